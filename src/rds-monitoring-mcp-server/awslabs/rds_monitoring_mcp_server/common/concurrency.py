@@ -0,0 +1,48 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared thread pool for blocking AWS SDK calls made by the Amazon RDS Monitoring MCP Server."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+
+T = TypeVar('T')
+
+# Maximum number of AWS API calls that may be in flight at once across all requests
+IO_EXECUTOR_MAX_WORKERS = 16
+
+IO_EXECUTOR = ThreadPoolExecutor(
+    max_workers=IO_EXECUTOR_MAX_WORKERS, thread_name_prefix='rds-mcp-io'
+)
+
+
+def run_in_io_executor(func: Callable[..., T], *args: Any, **kwargs: Any) -> 'asyncio.Future[T]':
+    """Run a blocking function on the shared I/O thread pool.
+
+    The call is submitted as soon as this function returns, so the returned future can be
+    awaited later to overlap the call with other work on the event loop.
+
+    Args:
+        func: The blocking function to call, typically a boto3 client method
+        *args: Positional arguments to pass to the function
+        **kwargs: Keyword arguments to pass to the function
+
+    Returns:
+        An asyncio future resolving to the return value of the function
+    """
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(IO_EXECUTOR, partial(func, *args, **kwargs))
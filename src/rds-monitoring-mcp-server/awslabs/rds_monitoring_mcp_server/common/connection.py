@@ -44,12 +44,18 @@ class BaseConnectionManager:
             retry_mode = os.environ.get(f'{cls._env_prefix}_RETRY_MODE', 'standard')
             connect_timeout = int(os.environ.get(f'{cls._env_prefix}_CONNECT_TIMEOUT', '5'))
             read_timeout = int(os.environ.get(f'{cls._env_prefix}_READ_TIMEOUT', '10'))
+            # Keep enough pooled connections for concurrent calls from the shared I/O pool
+            # so they reuse warm TLS sessions instead of reconnecting
+            max_pool_connections = int(
+                os.environ.get(f'{cls._env_prefix}_MAX_POOL_CONNECTIONS', '50')
+            )
 
             # Create boto3 config with retry settings
             config = Config(
                 retries={'max_attempts': max_retries, 'mode': retry_mode},
                 connect_timeout=connect_timeout,
                 read_timeout=read_timeout,
+                max_pool_connections=max_pool_connections,
                 # Configure custom user agent to identify requests from LLM/MCP
                 user_agent_extra='MCP/AmazonRDSMonitoringPlaneMCPServer',
             )
@@ -14,11 +14,15 @@
 
 """Constants used across the Amazon RDS Monitoring MCP Server."""
 
+from typing import Mapping, Tuple
+
+
 # MCP Server Version
 MCP_SERVER_VERSION = '0.1.0'
 
-# A tag attached to any resources created by the MCP server
-MCP_SERVER_TAGS = [
+# Tags attached to any resources created by the MCP server. The tuple is shared, so callers
+# pass boto3 a copy of it rather than the constant itself
+MCP_SERVER_TAGS: Tuple[Mapping[str, str], ...] = (
     {'Key': 'mcp_server_version', 'Value': MCP_SERVER_VERSION},
     {'Key': 'created_by', 'Value': 'rds-control-plane-mcp-server'},
-]
+)
@@ -27,6 +27,48 @@ ERROR_AWS_API = 'AWS API error: {}'
 ERROR_UNEXPECTED = 'Unexpected error: {}'
 
 
+def _build_error_response(operation: str, error: Exception) -> str:
+    """Log an exception and build the standardized JSON error response for it.
+
+    Args:
+        operation: The name of the operation that failed
+        error: The exception raised by the operation
+
+    Returns:
+        The JSON error response
+    """
+    if isinstance(error, ClientError):
+        # Same fallbacks botocore uses when formatting a ClientError without these fields
+        aws_error = error.response.get('Error', {})
+        error_code = aws_error.get('Code', 'Unknown')
+        error_message = aws_error.get('Message', 'Unknown')
+        logger.error(f'Failed with AWS error {error_code}: {error_message}')
+
+        # JSON error response
+        return json.dumps(
+            {
+                'error': ERROR_AWS_API.format(error_code),
+                'error_code': error_code,
+                'error_message': error_message,
+                'operation': operation,
+            },
+            indent=2,
+        )
+
+    logger.exception(f'Failed with unexpected error: {str(error)}')
+
+    # general exceptions
+    return json.dumps(
+        {
+            'error': ERROR_UNEXPECTED.format(str(error)),
+            'error_type': type(error).__name__,
+            'error_message': str(error),
+            'operation': operation,
+        },
+        indent=2,
+    )
+
+
 def handle_exceptions(func: Callable) -> Callable:
     """Decorator to handle exceptions in MCP operations.
 
@@ -39,42 +81,24 @@ def handle_exceptions(func: Callable) -> Callable:
     Returns:
         The wrapped function that handles exceptions
     """
+    # Decide once at decoration time whether the function must be awaited; both wrappers
+    # are coroutines so callers can always await the decorated function
+    if iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as error:
+                return _build_error_response(func.__name__, error)
+
+        return async_wrapper
 
     @wraps(func)
-    async def wrapper(*args: Any, **kwargs: Any):
+    async def sync_wrapper(*args: Any, **kwargs: Any):
         try:
-            if iscoroutinefunction(func):
-                # If the decorated function is a coroutine, await it
-                return await func(*args, **kwargs)
             return func(*args, **kwargs)
         except Exception as error:
-            if isinstance(error, ClientError):
-                error_code = error.response['Error']['Code']
-                error_message = error.response['Error']['Message']
-                logger.error(f'Failed with AWS error {error_code}: {error_message}')
-
-                # JSON error response
-                return json.dumps(
-                    {
-                        'error': ERROR_AWS_API.format(error_code),
-                        'error_code': error_code,
-                        'error_message': error_message,
-                        'operation': func.__name__,
-                    },
-                    indent=2,
-                )
-            else:
-                logger.exception(f'Failed with unexpected error: {str(error)}')
-
-                # general exceptions
-                return json.dumps(
-                    {
-                        'error': ERROR_UNEXPECTED.format(str(error)),
-                        'error_type': type(error).__name__,
-                        'error_message': str(error),
-                        'operation': func.__name__,
-                    },
-                    indent=2,
-                )
-
-    return wrapper
+            return _build_error_response(func.__name__, error)
+
+    return sync_wrapper
@@ -26,6 +26,30 @@ PERIOD = 50
 _call_times = defaultdict(lambda: deque(maxlen=CALLS_PER_PERIOD_LIMIT))
 
 
+def try_acquire(func_name: str) -> bool:
+    """Record a call to func_name if it is still within its rate limit.
+
+    Args:
+        func_name: The name of the rate limited function
+
+    Returns:
+        True if the call was recorded, False if CALLS_PER_PERIOD_LIMIT calls were already made
+        in the last PERIOD seconds
+    """
+    current_time = time.time()
+    # At most CALLS_PER_PERIOD_LIMIT timestamps are kept, so the expiry scan is bounded
+    call_times = _call_times[func_name]
+
+    while call_times and current_time - call_times[0] >= PERIOD:
+        call_times.popleft()
+
+    if len(call_times) >= CALLS_PER_PERIOD_LIMIT:
+        return False
+
+    call_times.append(current_time)
+    return True
+
+
 def rate_limiter(func: Callable) -> Callable:
     """Decorator to limit function calls to CALLS_PER_PERIOD_LIMIT times per PERIOD seconds.
 
@@ -35,18 +59,13 @@ def rate_limiter(func: Callable) -> Callable:
 
     @wraps(func)
     async def wrapper(*args, **kwargs) -> Any:
-        current_time = time.time()
         func_name = func.__name__
 
-        while _call_times[func_name] and current_time - _call_times[func_name][0] >= PERIOD:
-            _call_times[func_name].popleft()
-
-        if len(_call_times[func_name]) >= CALLS_PER_PERIOD_LIMIT:
+        if not try_acquire(func_name):
             raise Exception(
                 f'Rate limit exceeded: {func_name} can only be called {CALLS_PER_PERIOD_LIMIT} times per {PERIOD} seconds. Please wait before retrying.'
             )
 
-        _call_times[func_name].append(current_time)
         return await func(*args, **kwargs)
 
     return wrapper
@@ -14,15 +14,45 @@
 
 """Utility functions for the RDS Monitoring MCP Server."""
 
+import re
 from .context import RDSContext
 from botocore.client import BaseClient
+from botocore.paginate import Paginator
 from datetime import datetime
+from functools import lru_cache
 from loguru import logger
 from typing import Any, Callable, Dict, List, Optional, TypeVar
+from weakref import WeakKeyDictionary
 
 
 T = TypeVar('T', bound=object)
 
+# Paginators per client, dropped automatically once the client is closed and released
+_PAGINATORS: 'WeakKeyDictionary[BaseClient, Dict[str, Paginator]]' = WeakKeyDictionary()
+
+
+def get_paginator(client: BaseClient, paginator_name: str) -> Paginator:
+    """Get a paginator for the client, reusing the one built by a previous call.
+
+    Building a paginator walks the service model and creates a new class each time, while
+    a paginator itself holds no per-request state and can be reused across calls.
+
+    Args:
+        client: Boto3 client that owns the paginator
+        paginator_name: Name of the paginator to get (e.g. 'describe_db_clusters')
+
+    Returns:
+        The paginator for the given operation
+    """
+    paginators = _PAGINATORS.get(client)
+    if paginators is None:
+        paginators = _PAGINATORS.setdefault(client, {})
+
+    paginator = paginators.get(paginator_name)
+    if paginator is None:
+        paginator = paginators[paginator_name] = client.get_paginator(paginator_name)
+    return paginator
+
 
 def handle_paginated_aws_api_call(
     client: BaseClient,
@@ -44,15 +74,12 @@ def handle_paginated_aws_api_call(
         List of results, either formatted or raw depending on format_function
     """
     results = []
-    paginator = client.get_paginator(paginator_name)
+    paginator = get_paginator(client, paginator_name)
     operation_parameters['PaginationConfig'] = RDSContext.get_pagination_config()
     page_iterator = paginator.paginate(**operation_parameters)
     for page in page_iterator:
-        for item in page.get(result_key, []):
-            if format_function:
-                results.append(format_function(item))
-            else:
-                results.append(item)
+        items = page.get(result_key, [])
+        results.extend(map(format_function, items) if format_function else items)
 
     return results
 
@@ -66,9 +93,7 @@ def convert_datetime_to_string(obj: Any) -> Any:
     Returns:
         Object with datetime objects converted to strings
     """
-    import datetime
-
-    if isinstance(obj, datetime.datetime):
+    if isinstance(obj, datetime):
         return obj.isoformat()
     elif isinstance(obj, dict):
         return {k: convert_datetime_to_string(v) for k, v in obj.items()}
@@ -77,58 +102,95 @@ def convert_datetime_to_string(obj: Any) -> Any:
     return obj
 
 
-def convert_string_to_datetime(default: datetime, date_string: Optional[str] = None) -> datetime:
-    """Convert date strings to datetime objects.
+@lru_cache(maxsize=256)
+def parse_iso_datetime(date_str: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC.
 
-    Handles multiple date formats and provides robust error handling.
+    Unlike convert_string_to_datetime, no other formats are accepted and invalid input is
+    not replaced by a default. Results are memoized since clients typically repeat the
+    same time window across consecutive tool calls.
 
     Args:
-        default: The default date to fallback on if parsing fails
-        date_string: Date string in ISO format or other common formats
+        date_str: The ISO 8601 timestamp to parse (e.g., 2025-06-01T00:00:00Z)
 
     Returns:
-        A datetime object
+        The parsed datetime
 
     Raises:
-        ValueError: If the date strings are provided but cannot be parsed
+        ValueError: If the string is not a valid ISO 8601 timestamp
     """
-    import re
-    from datetime import datetime
+    if date_str.endswith('Z'):
+        date_str = date_str[:-1] + '+00:00'
+    return datetime.fromisoformat(date_str)
 
-    def parse_date_string(default: datetime, date_str: Optional[str] = None) -> datetime:
-        if not date_str or not isinstance(date_str, str):
-            return default
 
-        # Handle common formats
-        try:
-            # Try ISO format with Z (UTC) suffix
-            if date_str.endswith('Z'):
-                return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+@lru_cache(maxsize=1024)
+def _parse_date_string(date_str: str) -> Optional[datetime]:
+    """Parse a date string in one of the supported formats.
 
-            # Try ISO format directly
-            if 'T' in date_str or '-' in date_str:
-                return datetime.fromisoformat(date_str)
+    Results are memoized since clients typically repeat the same time window
+    across consecutive tool calls.
 
-            # Try simple YYYY-MM-DD format
-            if re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
-                return datetime.strptime(date_str, '%Y-%m-%d')
+    Args:
+        date_str: Date string in ISO format or other common formats
+
+    Returns:
+        The parsed datetime, or None if the string does not match any supported format
 
-            # Try MM/DD/YYYY format
-            if re.match(r'^\d{1,2}/\d{1,2}/\d{4}$', date_str):
-                return datetime.strptime(date_str, '%m/%d/%Y')
+    Raises:
+        ValueError: If the date string matches a format but cannot be parsed
+    """
+    # Handle common formats
+    try:
+        # Try ISO format with Z (UTC) suffix
+        if date_str.endswith('Z'):
+            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
 
-            # Try Unix timestamp (seconds since epoch)
-            if date_str.isdigit():
-                return datetime.fromtimestamp(int(date_str))
+        # Try ISO format directly
+        if 'T' in date_str or '-' in date_str:
+            return datetime.fromisoformat(date_str)
 
-            # Default case if no format matches
-            return default
+        # Try simple YYYY-MM-DD format
+        if re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
+            return datetime.strptime(date_str, '%Y-%m-%d')
 
-        except ValueError as e:
-            raise ValueError(f"Invalid date format '{date_str}': {str(e)}")
+        # Try MM/DD/YYYY format
+        if re.match(r'^\d{1,2}/\d{1,2}/\d{4}$', date_str):
+            return datetime.strptime(date_str, '%m/%d/%Y')
+
+        # Try Unix timestamp (seconds since epoch)
+        if date_str.isdigit():
+            return datetime.fromtimestamp(int(date_str))
+
+        # No format matches
+        return None
+
+    except ValueError as e:
+        raise ValueError(f"Invalid date format '{date_str}': {str(e)}")
+
+
+def convert_string_to_datetime(default: datetime, date_string: Optional[str] = None) -> datetime:
+    """Convert date strings to datetime objects.
+
+    Handles multiple date formats and provides robust error handling.
+
+    Args:
+        default: The default date to fallback on if parsing fails
+        date_string: Date string in ISO format or other common formats
+
+    Returns:
+        A datetime object
+
+    Raises:
+        ValueError: If the date strings are provided but cannot be parsed
+    """
+    if not date_string or not isinstance(date_string, str):
+        return default
 
     try:
-        return parse_date_string(default, date_string)
+        parsed = _parse_date_string(date_string)
     except ValueError as e:
         logger.warning(f"Error parsing end_date '{date_string}': {str(e)}. Using default value.")
         return default
+
+    return default if parsed is None else parsed
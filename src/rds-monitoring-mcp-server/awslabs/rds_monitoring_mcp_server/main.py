@@ -15,6 +15,7 @@
 """awslabs RDS Monitoring MCP Server implementation."""
 
 import argparse
+import sys
 from awslabs.rds_monitoring_mcp_server.common.constants import MCP_SERVER_VERSION
 from awslabs.rds_monitoring_mcp_server.common.context import RDSContext
 from awslabs.rds_monitoring_mcp_server.common.server import mcp
@@ -48,6 +49,12 @@ def main():
 
     args = parser.parse_args()
 
+    # Hand log records to a background thread so formatting and writing them, including
+    # tracebacks during a burst of AWS errors, stays off the event loop. Records still
+    # queued when the process crashes can be lost.
+    logger.remove()
+    logger.add(sys.stderr, enqueue=True, backtrace=False, diagnose=False)
+
     mcp.settings.port = args.port
     RDSContext.initialize(args.readonly, args.max_items, args.register_resources_as_tools)
 
@@ -14,7 +14,7 @@
 
 """Resource for retrieving detailed information about RDS DB Clusters."""
 
-import asyncio
+from ...common.concurrency import run_in_io_executor
 from ...common.connection import RDSConnectionManager
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.decorators.register_mcp_primitive import register_mcp_primitive_by_context
@@ -87,7 +87,7 @@ async def describe_cluster_detail(
     """
     logger.info(f'Getting cluster detail resource for {cluster_id}')
     rds_client = RDSConnectionManager.get_connection()
-    response = await asyncio.to_thread(
+    response = await run_in_io_executor(
         rds_client.describe_db_clusters, DBClusterIdentifier=cluster_id
     )
 
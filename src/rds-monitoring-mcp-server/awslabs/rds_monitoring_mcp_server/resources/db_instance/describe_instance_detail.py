@@ -14,7 +14,7 @@
 
 """Resource for retrieving detailed information about RDS DB Instances."""
 
-import asyncio
+from ...common.concurrency import run_in_io_executor
 from ...common.connection import RDSConnectionManager
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.decorators.register_mcp_primitive import register_mcp_primitive_by_context
@@ -82,7 +82,7 @@ async def describe_instance_detail(
     logger.info(f'Getting instance detail resource for {instance_id}')
     rds_client = RDSConnectionManager.get_connection()
 
-    response = await asyncio.to_thread(
+    response = await run_in_io_executor(
         rds_client.describe_db_instances, DBInstanceIdentifier=instance_id
     )
 
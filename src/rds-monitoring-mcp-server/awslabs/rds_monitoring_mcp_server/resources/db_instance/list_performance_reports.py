@@ -14,7 +14,7 @@
 
 """Resource for listing available RDS DB Performance Reports."""
 
-import asyncio
+from ...common.concurrency import run_in_io_executor
 from ...common.connection import PIConnectionManager
 from ...common.context import RDSContext as Context
 from ...common.decorators.handle_exceptions import handle_exceptions
@@ -142,7 +142,7 @@ async def list_performance_reports(
         if next_token:
             request_params['NextToken'] = next_token
 
-        response = await asyncio.to_thread(
+        response = await run_in_io_executor(
             pi_client.list_performance_analysis_reports, **request_params
         )
 
@@ -15,6 +15,7 @@
 """Performance report creation tool for RDS instances."""
 
 from ...common.connection import PIConnectionManager
+from ...common.constants import MCP_SERVER_TAGS
 from ...common.context import RDSContext
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.server import mcp
@@ -137,10 +138,7 @@ async def create_performance_report(
         'Identifier': dbi_resource_identifier,
         'StartTime': start,
         'EndTime': end,
-        'Tags': [
-            {'Key': 'mcp_server_version', 'Value': 'latest'},
-            {'Key': 'created_by', 'Value': 'rds-control-plane-mcp-server'},
-        ],
+        'Tags': [dict(tag) for tag in MCP_SERVER_TAGS],
     }
 
     pi_client = PIConnectionManager.get_connection()
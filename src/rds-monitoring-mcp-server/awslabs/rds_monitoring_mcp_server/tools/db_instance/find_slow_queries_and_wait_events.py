@@ -14,15 +14,27 @@
 
 """find_slow_queries_and_wait_events data models, helpers and tool implementation."""
 
+import sys
+from ...common.concurrency import run_in_io_executor
 from ...common.connection import PIConnectionManager
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.server import mcp
 from ...common.utils import convert_string_to_datetime
 from datetime import datetime, timedelta
+from functools import lru_cache
 from loguru import logger
 from mcp.types import ToolAnnotations
+from operator import attrgetter
 from pydantic import BaseModel, Field
-from typing import Any, Dict, List, Literal, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple
+
+
+DIMENSION_GROUPS = ('db.wait_event', 'db.sql_tokenized')
+
+_METRIC_NAMES = {
+    calculation: sys.intern(f'db.load.{calculation}')
+    for calculation in ('avg', 'min', 'max', 'sum')
+}
 
 
 # Data Models
@@ -31,7 +43,7 @@ from typing import Any, Dict, List, Literal, Optional
 class MetricDataPoint(BaseModel):
     """Represents a single data point in a time series metric."""
 
-    timestamp: str = Field(..., description='ISO8601 formatted timestamp')
+    timestamp: datetime = Field(..., description='Timestamp of the data point')
     value: float = Field(..., description='The metric value at this timestamp')
 
 
@@ -67,10 +79,11 @@ class SlowQueriesAndWaitEventsResponse(BaseModel):
 
     resource_identifier: str = Field(..., description='The DbiResourceId of the analyzed instance')
     dimension: str = Field(
-        ..., description='The dimension used for grouping (db.wait_event or db.sql_tokenized)'
+        ...,
+        description='The dimension used for grouping (db.wait_event, db.sql_tokenized or both)',
     )
     calculation: str = Field(..., description='The calculation method used (avg, min, max, sum)')
-    time_range: Dict[str, str] = Field(
+    time_range: Dict[str, datetime] = Field(
         ..., description='The time range of the analysis with start and end timestamps'
     )
     period_seconds: int = Field(..., description='The granularity of data points in seconds')
@@ -83,6 +96,44 @@ class SlowQueriesAndWaitEventsResponse(BaseModel):
 # Helper Functions
 
 
+def get_dimension_groups(dimension: str) -> Tuple[str, ...]:
+    """Get the dimension groups that are queried for a dimension argument.
+
+    Args:
+        dimension: The dimension argument of the tool ('db.wait_event', 'db.sql_tokenized' or
+            'both')
+
+    Returns:
+        The queried dimension group names
+    """
+    return DIMENSION_GROUPS if dimension == 'both' else (dimension,)
+
+
+@lru_cache(maxsize=512)
+def _build_metric_queries(
+    dimension: str,
+    calculation: str,
+    limit: int,
+) -> Tuple[Dict[str, Any], ...]:
+    """Build and memoize the Performance Insights metric queries for a given signature.
+
+    The set of possible inputs is small and bounded by the tool's Literal arguments,
+    so each query shape is only constructed once per process.
+    """
+    metric_name = _METRIC_NAMES[calculation]
+
+    return tuple(
+        {
+            'Metric': metric_name,
+            'GroupBy': {
+                'Group': group,
+                'Limit': limit,
+            },
+        }
+        for group in get_dimension_groups(dimension)
+    )
+
+
 def build_metric_queries(
     dimension: str,
     calculation: str,
@@ -91,24 +142,85 @@ def build_metric_queries(
     """Build Performance Insights metric queries.
 
     Args:
-        dimension: The dimension to group by ('db.wait_event' or 'db.sql_tokenized')
+        dimension: The dimension to group by ('db.wait_event', 'db.sql_tokenized' or 'both').
+            'both' issues one query per dimension group in a single API request.
         calculation: The aggregate calculation method ('avg', 'min', 'max', 'sum')
-        limit: Maximum number of items to return
+        limit: Maximum number of items to return per dimension group
 
     Returns:
-        List of metric query dictionaries for the Performance Insights API
+        List of metric query dictionaries for the Performance Insights API. The query
+        dictionaries are shared between calls and must be treated as read-only.
     """
-    metric_name = f'db.load.{calculation}'
+    return list(_build_metric_queries(dimension, calculation, limit))
 
-    return [
-        {
-            'Metric': metric_name,
-            'GroupBy': {
-                'Group': dimension,
-                'Limit': limit,
-            },
-        }
-    ]
+
+def get_dimension_group(dimensions: Dict[str, str], groups: Tuple[str, ...]) -> Optional[str]:
+    """Get the queried dimension group a metric result belongs to.
+
+    The metric keys in a get_resource_metrics response do not say which GroupBy they answer.
+    When a single group was queried every result belongs to it; otherwise the result is
+    matched to the queried group that prefixes its dimension keys (e.g., 'db.wait_event.name').
+
+    Args:
+        dimensions: The dimensions of a metric result
+        groups: The dimension groups that were queried
+
+    Returns:
+        The dimension group name, or None if no dimension key names a queried group
+    """
+    if len(groups) == 1:
+        return groups[0]
+    for key in dimensions:
+        for group in groups:
+            if key.startswith(f'{group}.'):
+                return group
+    return None
+
+
+async def fetch_resource_metrics(pi_client: Any, **params: Any) -> List[Dict[str, Any]]:
+    """Fetch all pages of a Performance Insights get_resource_metrics request.
+
+    Performance Insights does not provide a paginator for get_resource_metrics, so the
+    NextToken chain is followed manually. Each request runs in a worker thread to avoid
+    blocking the event loop, and metric results spread across pages are merged by their
+    metric name and dimensions.
+
+    Args:
+        pi_client: The Performance Insights client to use for the API calls
+        **params: Parameters to pass to get_resource_metrics
+
+    Returns:
+        List of merged metric results across all pages
+    """
+    merged: Dict[Any, Dict[str, Any]] = {}
+    next_token = None
+    get_resource_metrics = pi_client.get_resource_metrics
+
+    while True:
+        if next_token:
+            params['NextToken'] = next_token
+
+        response = await run_in_io_executor(get_resource_metrics, **params)
+
+        for metric_result in response.get('MetricList', []):
+            key = metric_result.get('Key', {})
+            merge_key = (
+                key.get('Metric'),
+                tuple(sorted(key.get('Dimensions', {}).items())),
+            )
+            if merge_key in merged:
+                merged[merge_key]['DataPoints'].extend(metric_result.get('DataPoints', []))
+            else:
+                merged[merge_key] = {
+                    'Key': key,
+                    'DataPoints': list(metric_result.get('DataPoints', [])),
+                }
+
+        next_token = response.get('NextToken')
+        if not next_token:
+            break
+
+    return list(merged.values())
 
 
 def process_metric_results(
@@ -120,11 +232,12 @@ def process_metric_results(
 
     Args:
         metric_list: Raw metric results from Performance Insights API
-        dimension: The dimension used for grouping
-        limit: Maximum number of results to return
+        dimension: The dimension the results were queried for ('db.wait_event',
+            'db.sql_tokenized' or 'both')
+        limit: Maximum number of results to return per dimension group
 
     Returns:
-        List of processed MetricResult objects
+        List of processed MetricResult objects sorted by average value descending
     """
     results = []
 
@@ -135,32 +248,28 @@ def process_metric_results(
         if not dimension_details:
             continue
 
-        # Filter datapoints to only include non-zero values
+        # Filter datapoints to only include non-zero values, accumulating the total in the
+        # same pass. The raw values come straight from the PI API, so the datapoints and
+        # results are built with model_construct to skip per-instance validation.
         datapoints = []
-        raw_datapoints = metric_result.get('DataPoints', [])
+        total = 0.0
 
-        for dp in raw_datapoints:
+        for dp in metric_result.get('DataPoints', []):
             value = dp.get('Value', 0)
             # Only include datapoints with non-zero values
             if value > 0:
-                timestamp = dp['Timestamp']
-                if isinstance(timestamp, datetime):
-                    timestamp = timestamp.isoformat()
-
+                total += value
                 datapoints.append(
-                    MetricDataPoint(
-                        timestamp=timestamp,
-                        value=value,
-                    )
+                    MetricDataPoint.model_construct(timestamp=dp['Timestamp'], value=value)
                 )
 
         # Only include results that have non-zero datapoints
         if not datapoints:
             continue
 
-        average_value = sum(dp.value for dp in datapoints) / len(datapoints)
+        average_value = total / len(datapoints)
 
-        result = MetricResult(
+        result = MetricResult.model_construct(
             metric_name=metric_result.get('Key', {}).get('Metric', ''),
             dimensions=dimension_details,
             datapoints=datapoints,
@@ -169,9 +278,20 @@ def process_metric_results(
 
         results.append(result)
 
-    # Sort by average value descending and apply limit
-    results.sort(key=lambda x: x.average_value or 0, reverse=True)
-    return results[:limit]
+    # Sort by average value descending and apply the limit to each dimension group. Every
+    # result built above has a numeric average, so a C-level attrgetter can serve as the key.
+    results.sort(key=attrgetter('average_value'), reverse=True)
+    groups = get_dimension_groups(dimension)
+    # Results that cannot be matched to a queried group share a single None bucket
+    group_counts: Dict[Optional[str], int] = {}
+    limited_results = []
+    for result in results:
+        group = get_dimension_group(result.dimensions, groups)
+        if group_counts.get(group, 0) < limit:
+            group_counts[group] = group_counts.get(group, 0) + 1
+            limited_results.append(result)
+
+    return limited_results
 
 
 # MCP Tool Args
@@ -197,36 +317,50 @@ TOOL_DESCRIPTION = """Find slow queries and wait events in RDS databases.
 )
 @handle_exceptions
 async def find_slow_queries_and_wait_events(
-    dbi_resource_identifier: str = Field(
-        ...,
-        description='The DbiResourceId of the RDS instance (e.g., db-EXAMPLEDBIID) to analyze for performance issues',
-    ),
-    dimension: Literal['db.wait_event', 'db.sql_tokenized'] = Field(
-        ...,
-        description='The dimension to group by. Use "db.wait_event" for wait events or "db.sql_tokenized" for SQL queries',
-    ),
-    calculation: Literal['avg', 'min', 'max', 'sum'] = Field(
-        ...,
-        description='The aggregate calculation method to apply to the DBLoad metric',
-    ),
-    start_time: Optional[str] = Field(
-        None,
-        description='The beginning of the time interval to analyze (ISO8601 format, e.g., "2025-06-01T00:00:00Z")',
-    ),
-    end_time: Optional[str] = Field(
-        None,
-        description='The end of the time interval to analyze (ISO8601 format, e.g., "2025-06-01T12:00:00Z")',
-    ),
-    period_in_seconds: Literal[1, 60, 300, 3600, 86400] = Field(
-        300,
-        description='The granularity of data points in seconds (1=per second, 60=per minute, 300=5 minutes, 3600=hourly, 86400=daily)',
-    ),
-    limit: int = Field(
-        10,
-        description='Maximum number of items to return for the dimension group (1-50)',
-        ge=1,
-        le=50,
-    ),
+    dbi_resource_identifier: Annotated[
+        str,
+        Field(
+            description='The DbiResourceId of the RDS instance (e.g., db-EXAMPLEDBIID) to analyze for performance issues',
+        ),
+    ],
+    dimension: Annotated[
+        Literal['db.wait_event', 'db.sql_tokenized', 'both'],
+        Field(
+            description='The dimension to group by. Use "db.wait_event" for wait events, "db.sql_tokenized" for SQL queries, or "both" to retrieve both in a single request',
+        ),
+    ],
+    calculation: Annotated[
+        Literal['avg', 'min', 'max', 'sum'],
+        Field(
+            description='The aggregate calculation method to apply to the DBLoad metric',
+        ),
+    ],
+    start_time: Annotated[
+        Optional[str],
+        Field(
+            description='The beginning of the time interval to analyze (ISO8601 format, e.g., "2025-06-01T00:00:00Z")',
+        ),
+    ] = None,
+    end_time: Annotated[
+        Optional[str],
+        Field(
+            description='The end of the time interval to analyze (ISO8601 format, e.g., "2025-06-01T12:00:00Z")',
+        ),
+    ] = None,
+    period_in_seconds: Annotated[
+        Literal[1, 60, 300, 3600, 86400],
+        Field(
+            description='The granularity of data points in seconds (1=per second, 60=per minute, 300=5 minutes, 3600=hourly, 86400=daily)',
+        ),
+    ] = 300,
+    limit: Annotated[
+        int,
+        Field(
+            description='Maximum number of items to return for the dimension group (1-50)',
+            ge=1,
+            le=50,
+        ),
+    ] = 10,
 ) -> SlowQueriesAndWaitEventsResponse:
     """Find slow queries and wait events in RDS databases using Performance Insights.
 
@@ -236,12 +370,12 @@ async def find_slow_queries_and_wait_events(
 
     Args:
         dbi_resource_identifier: The DbiResourceId of the RDS instance
-        dimension: The dimension to group by ('db.wait_event' or 'db.sql_tokenized')
+        dimension: The dimension to group by ('db.wait_event', 'db.sql_tokenized' or 'both')
         calculation: The aggregate calculation method ('avg', 'min', 'max', or 'sum')
         start_time: The beginning of the time interval (ISO8601 format)
         end_time: The end of the time interval (ISO8601 format)
         period_in_seconds: The granularity of data points
-        limit: Maximum number of items to return
+        limit: Maximum number of items to return for each dimension group
 
 
     Returns:
@@ -250,23 +384,16 @@ async def find_slow_queries_and_wait_events(
     Raises:
         ValueError: If Performance Insights is not enabled or parameters are invalid
     """
-    # Handle FieldInfo objects that may be passed instead of actual values during unit tests
-    start_time_value = start_time if isinstance(start_time, str) else None
-    end_time_value = end_time if isinstance(end_time, str) else None
-    period_seconds_value = period_in_seconds if isinstance(period_in_seconds, int) else 300
-    limit_value = limit if isinstance(limit, int) else 10
-
     now = datetime.now()
-    start = convert_string_to_datetime(
-        default=now - timedelta(hours=1), date_string=start_time_value
-    )
-    end = convert_string_to_datetime(default=now, date_string=end_time_value)
+    start = convert_string_to_datetime(default=now - timedelta(hours=1), date_string=start_time)
+    end = convert_string_to_datetime(default=now, date_string=end_time)
 
-    metric_queries = build_metric_queries(dimension, calculation, limit_value)
+    metric_queries = build_metric_queries(dimension, calculation, limit)
 
     pi_client = PIConnectionManager.get_connection()
 
-    response = pi_client.get_resource_metrics(
+    metric_list = await fetch_resource_metrics(
+        pi_client,
         ServiceType='RDS',
         Identifier=dbi_resource_identifier,
         MetricQueries=metric_queries,
@@ -276,27 +403,29 @@ async def find_slow_queries_and_wait_events(
     )
 
     metric_results = process_metric_results(
-        metric_list=response.get('MetricList', []),
+        metric_list=metric_list,
         dimension=dimension,
-        limit=limit_value,
+        limit=limit,
     )
 
     result = SlowQueriesAndWaitEventsResponse(
         resource_identifier=dbi_resource_identifier,
         dimension=dimension,
         calculation=calculation,
-        time_range={
-            'start': start.isoformat(),
-            'end': end.isoformat(),
-        },
-        period_seconds=period_seconds_value,
+        time_range={'start': start, 'end': end},
+        period_seconds=period_in_seconds,
         results=metric_results,
         count=len(metric_results),
     )
 
-    logger.info(
-        f'Retrieved {len(metric_results)} {dimension} results for {dbi_resource_identifier} '
-        f'from {start.isoformat()} to {end.isoformat()}'
+    # Lazily format the message so nothing is computed when INFO logging is disabled
+    logger.opt(lazy=True).info(
+        'Retrieved {} {} results for {} from {} to {}',
+        lambda: len(metric_results),
+        lambda: dimension,
+        lambda: dbi_resource_identifier,
+        lambda: start.isoformat(),
+        lambda: end.isoformat(),
     )
 
     return result
@@ -15,18 +15,21 @@
 """read_db_log_file data models, helpers and tool implementation."""
 
 import re
+from ...common.concurrency import run_in_io_executor
 from ...common.connection import RDSConnectionManager
 from ...common.decorators.handle_exceptions import handle_exceptions
-from ...common.decorators.rate_limit import rate_limiter
+from ...common.decorators.rate_limit import rate_limiter, try_acquire
 from ...common.server import mcp
 from mcp.server.fastmcp import Context as FastMCPContext
-from pydantic import BaseModel, Field, fields
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Annotated, Iterator, Optional
 
 
 TOOL_DESCRIPTION = """Read database log files from RDS instances.
 
 This tool retrieves contents of database log files from Amazon RDS instances, allowing you to download log file portions, search for specific patterns, and paginate through large log files to troubleshoot database issues.
+
+When a pattern is provided, the tool keeps reading subsequent portions of the log file (up to max_api_calls) until number_of_lines matching lines have been collected or the end of the file is reached. Every portion read counts toward the tool's rate limit, so fewer portions may be read when the limit is close.
 """
 
 
@@ -53,6 +56,54 @@ class DBLogFileResponse(BaseModel):
     )
 
 
+def _iter_lines(content: str) -> Iterator[str]:
+    """Lazily yield the lines of the content without building a list of all of them.
+
+    Args:
+        content: Newline-delimited text to split
+
+    Yields:
+        str: Each line, without its line terminator
+    """
+    start = 0
+    length = len(content)
+    while start < length:
+        end = content.find('\n', start)
+        if end == -1:
+            end = length
+        line = content[start:end]
+        yield line[:-1] if line.endswith('\r') else line
+        start = end + 1
+
+
+def _iter_lines_containing(content: str, pattern: str) -> Iterator[str]:
+    """Yield the lines of the content that contain the pattern as a substring.
+
+    Rather than splitting the whole buffer into lines and testing each of them, this
+    jumps between occurrences of the pattern with str.find and slices out only the
+    enclosing lines, so lines without a match are never materialized.
+
+    Args:
+        content: Newline-delimited text to scan
+        pattern: Substring to look for
+
+    Yields:
+        str: Each matching line, without its line terminator
+    """
+    if '\n' in pattern:
+        # A single line can never contain a line break
+        return
+    pos = content.find(pattern)
+    while pos != -1:
+        start = content.rfind('\n', 0, pos) + 1
+        end = content.find('\n', pos + len(pattern))
+        if end == -1:
+            end = len(content)
+        line = content[start:end]
+        yield line[:-1] if line.endswith('\r') else line
+        pos = content.find(pattern, end + 1)
+
+
 async def preprocess_log_content(
     log_file_content: str,
     pattern: Optional[str] = None,
@@ -73,28 +124,19 @@ async def preprocess_log_content(
     Returns:
         str: The processed log content, filtered by the pattern
     """
-    # Handle FieldInfo objects that may be passed instead of actual values
-    pattern_value = pattern if isinstance(pattern, str) else None
-    if isinstance(pattern, fields.FieldInfo):
-        pattern_value = None
-
-    use_regex_value = use_regex if isinstance(use_regex, bool) else False
-    if isinstance(use_regex, fields.FieldInfo):
-        use_regex_value = False
-
-    if not pattern_value or not log_file_content:
+    if not pattern or not log_file_content:
         return log_file_content
 
-    if use_regex_value:
+    if use_regex:
         try:
-            regex = re.compile(pattern_value)
-            return '\n'.join(line for line in log_file_content.splitlines() if regex.search(line))
+            regex = re.compile(pattern)
+            return '\n'.join(filter(regex.search, _iter_lines(log_file_content)))
         except re.error as e:
             if ctx:
                 await ctx.error(f'Regex Error: {str(e)}')
             return log_file_content
     else:
-        return '\n'.join(line for line in log_file_content.splitlines() if pattern_value in line)
+        return '\n'.join(_iter_lines_containing(log_file_content, pattern))
 
 
 @mcp.tool(
@@ -104,32 +146,52 @@ async def preprocess_log_content(
 @handle_exceptions
 @rate_limiter
 async def read_db_log_file(
-    db_instance_identifier: str = Field(
-        ...,
-        description='The identifier of the RDS instance (DBInstanceIdentifier, not DbiResourceId) to read logs from.',
-    ),
-    log_file_name: str = Field(
-        ...,
-        description='The name of the log file to read (e.g., "error/postgresql.log").',
-    ),
-    marker: str = Field(
-        '0',
-        description='The pagination marker returned by a previous call to this tool for reading the next portion of a log file. Set to the first page by default.',
-    ),
-    number_of_lines: int = Field(
-        100,
-        description='The number of lines to read from the log file (default: 100).',
-        ge=1,
-        lt=10000,
-    ),
-    pattern: Optional[str] = Field(
-        None,
-        description='The pattern to filter log entries. By default, performs simple substring matching. Set use_regex=True to use regular expressions.',
-    ),
-    use_regex: bool = Field(
-        False,
-        description='Whether to treat the pattern as a regular expression. If False (default), performs simple substring matching.',
-    ),
+    db_instance_identifier: Annotated[
+        str,
+        Field(
+            description='The identifier of the RDS instance (DBInstanceIdentifier, not DbiResourceId) to read logs from.',
+        ),
+    ],
+    log_file_name: Annotated[
+        str,
+        Field(
+            description='The name of the log file to read (e.g., "error/postgresql.log").',
+        ),
+    ],
+    marker: Annotated[
+        str,
+        Field(
+            description='The pagination marker returned by a previous call to this tool for reading the next portion of a log file. Set to the first page by default.',
+        ),
+    ] = '0',
+    number_of_lines: Annotated[
+        int,
+        Field(
+            description='The number of lines to read from the log file (default: 100).',
+            ge=1,
+            lt=10000,
+        ),
+    ] = 100,
+    pattern: Annotated[
+        Optional[str],
+        Field(
+            description='The pattern to filter log entries. By default, performs simple substring matching. Set use_regex=True to use regular expressions.',
+        ),
+    ] = None,
+    use_regex: Annotated[
+        bool,
+        Field(
+            description='Whether to treat the pattern as a regular expression. If False (default), performs simple substring matching.',
+        ),
+    ] = False,
+    max_api_calls: Annotated[
+        int,
+        Field(
+            description='The maximum number of log file portions to read while collecting lines that match the pattern (default: 5). Each portion counts toward the rate limit. Ignored when no pattern is provided.',
+            ge=1,
+            le=20,
+        ),
+    ] = 5,
     ctx: Optional[FastMCPContext] = None,
 ) -> DBLogFileResponse:
     """Retrieve RDS database log file contents.
@@ -141,6 +203,7 @@ async def read_db_log_file(
         number_of_lines: Number of lines to retrieve (1-9999)
         pattern: Optional filter pattern to only return matching lines
         use_regex: Whether to treat the pattern as a regular expression (default: False)
+        max_api_calls: Maximum number of log file portions to read when filtering by pattern
         ctx: MCP context for logging and state management
 
     Returns:
@@ -148,38 +211,59 @@ async def read_db_log_file(
     """
     rds_client = RDSConnectionManager.get_connection()
 
-    # Handle FieldInfo objects that may be passed instead of actual values
-    number_of_lines_value = number_of_lines if isinstance(number_of_lines, int) else 100
-    if isinstance(number_of_lines, fields.FieldInfo):
-        number_of_lines_value = 100
-
-    marker_value = marker if isinstance(marker, str) else '0'
-    if isinstance(marker, fields.FieldInfo):
-        marker_value = '0'
-
     params = {
         'DBInstanceIdentifier': db_instance_identifier,
         'LogFileName': log_file_name,
-        'NumberOfLines': number_of_lines_value,
+        'NumberOfLines': number_of_lines,
     }
 
-    if marker_value and marker_value != '0':
-        params['Marker'] = marker_value
-
-    response = rds_client.download_db_log_file_portion(**params)
-
-    # Handle FieldInfo objects for pattern and use_regex parameters
-    pattern_value = pattern if isinstance(pattern, str) else None
-    if isinstance(pattern, fields.FieldInfo):
-        pattern_value = None
+    if marker and marker != '0':
+        params['Marker'] = marker
 
-    use_regex_value = use_regex if isinstance(use_regex, bool) else False
-    if isinstance(use_regex, fields.FieldInfo):
-        use_regex_value = False
-
-    log_content = await preprocess_log_content(
-        response.get('LogFileData', ''), pattern=pattern_value, use_regex=use_regex_value, ctx=ctx
-    )
+    # Without a pattern every portion is returned as-is, so a single read is enough
+    max_api_calls = max_api_calls if pattern else 1
+    if pattern and use_regex:
+        try:
+            re.compile(pattern)
+        except re.error:
+            # preprocess_log_content reports the error and returns the portion unfiltered
+            max_api_calls = 1
+
+    log_chunks = []
+    matched_lines = 0
+    download_log_file_portion = rds_client.download_db_log_file_portion
+
+    for api_call in range(max_api_calls):
+        # rate_limiter counted the first download; each further one draws on the same budget
+        if api_call and not try_acquire(read_db_log_file.__name__):
+            break
+
+        response = await run_in_io_executor(download_log_file_portion, **params)
+
+        # Pop the raw payload so it can be released as soon as it has been filtered
+        log_chunk = await preprocess_log_content(
+            response.pop('LogFileData', ''),
+            pattern=pattern,
+            use_regex=use_regex,
+            ctx=ctx,
+        )
+        if log_chunk:
+            log_chunks.append(log_chunk)
+            matched_lines += log_chunk.count('\n') + 1
+
+        next_marker = response.get('Marker', None)
+        if (
+            matched_lines >= number_of_lines
+            or not response.get('AdditionalDataPending', False)
+            or not next_marker
+        ):
+            break
+        params['Marker'] = next_marker
+
+    log_content = '\n'.join(log_chunks)
+    if matched_lines > number_of_lines:
+        # Portions are filtered whole, so the last one can push the total past the limit
+        log_content = '\n'.join(log_content.split('\n', number_of_lines)[:number_of_lines])
 
     result = DBLogFileResponse(
         log_content=log_content,
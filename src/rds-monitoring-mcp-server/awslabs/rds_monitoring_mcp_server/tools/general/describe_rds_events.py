@@ -21,8 +21,8 @@ from ...common.server import mcp
 from datetime import datetime
 from mcp.types import ToolAnnotations
 from mypy_boto3_rds.type_defs import EventTypeDef
-from pydantic import BaseModel, Field, fields
-from typing import List, Literal, Optional
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Annotated, List, Literal, Optional
 
 
 SOURCE_TYPE_TO_EVENT_CATEGORIES = {
@@ -61,13 +61,16 @@ SOURCE_TYPE_TO_EVENT_CATEGORIES = {
     'custom-engine-version': ['creation', 'failure', 'restoring'],
 }
 
+# Validates event dates that are not already datetime objects, e.g. from stubbed responses
+_DATE_ADAPTER = TypeAdapter(Optional[datetime])
+
 
 class Event(BaseModel):
     """A model representing a database event."""
 
     message: str = Field(..., description='Text of this event')
     event_categories: List[str] = Field(..., description='Categories for the event')
-    date: str = Field(..., description='Date and time of the event')
+    date: Optional[datetime] = Field(None, description='Date and time of the event')
     source_arn: Optional[str] = Field(
         None, description='The Amazon Resource Name (ARN) for the event'
     )
@@ -82,18 +85,16 @@ class Event(BaseModel):
         Returns:
             Event: A new Event instance populated with the AWS event data
         """
-        date_value = event.get('Date')
-        if date_value is None:
-            formatted_date = ''
-        elif isinstance(date_value, datetime):
-            formatted_date = date_value.isoformat()
-        else:
-            formatted_date = str(date_value)
-
-        return cls(
+        # The other fields are already typed by boto3, so only the date is validated, keeping
+        # the field a datetime even when the response carries a string
+        date = event.get('Date')
+        if not isinstance(date, datetime):
+            date = _DATE_ADAPTER.validate_python(date)
+
+        return cls.model_construct(
             message=event.get('Message', ''),
             event_categories=event.get('EventCategories', []),
-            date=formatted_date,
+            date=date,
             source_arn=event.get('SourceArn'),
         )
 
@@ -123,35 +124,48 @@ This tool retrieves events for RDS resources such as DB instances, clusters, sec
 )
 @handle_exceptions
 def describe_rds_events(
-    source_identifier: str = Field(
-        ...,
-        description='The identifier of the event source (e.g., DBInstanceIdentifier or DBClusterIdentifier). A valid identifier must be provided.',
-    ),
-    source_type: Literal[
-        'db-instance',
-        'db-parameter-group',
-        'db-security-group',
-        'db-snapshot',
-        'db-cluster',
-        'db-cluster-snapshot',
-        'custom-engine-version',
-        'db-proxy',
-        'blue-green-deployment',
-    ] = Field(..., description='The type of source'),
-    event_categories: Optional[List[str]] = Field(
-        None,
-        description='The categories of events (e.g., backup, configuration change, low storage, etc.)',
-    ),
-    duration: Optional[int] = Field(
-        None,
-        description='The number of minutes in the past to retrieve events (up to 14 days/20160 minutes)',
-    ),
-    start_time: Optional[str] = Field(
-        None, description='The beginning of the time interval to retrieve events (ISO8601 format)'
-    ),
-    end_time: Optional[str] = Field(
-        None, description='The end of the time interval to retrieve events (ISO8601 format)'
-    ),
+    source_identifier: Annotated[
+        str,
+        Field(
+            description='The identifier of the event source (e.g., DBInstanceIdentifier or DBClusterIdentifier). A valid identifier must be provided.',
+        ),
+    ],
+    source_type: Annotated[
+        Literal[
+            'db-instance',
+            'db-parameter-group',
+            'db-security-group',
+            'db-snapshot',
+            'db-cluster',
+            'db-cluster-snapshot',
+            'custom-engine-version',
+            'db-proxy',
+            'blue-green-deployment',
+        ],
+        Field(description='The type of source'),
+    ],
+    event_categories: Annotated[
+        Optional[List[str]],
+        Field(
+            description='The categories of events (e.g., backup, configuration change, low storage, etc.)',
+        ),
+    ] = None,
+    duration: Annotated[
+        Optional[int],
+        Field(
+            description='The number of minutes in the past to retrieve events (up to 14 days/20160 minutes)',
+        ),
+    ] = None,
+    start_time: Annotated[
+        Optional[str],
+        Field(
+            description='The beginning of the time interval to retrieve events (ISO8601 format)'
+        ),
+    ] = None,
+    end_time: Annotated[
+        Optional[str],
+        Field(description='The end of the time interval to retrieve events (ISO8601 format)'),
+    ] = None,
 ) -> EventList:
     """List events for an RDS resource.
 
@@ -166,9 +180,6 @@ def describe_rds_events(
     Returns:
         EventList: List of events for the specified resource
     """
-    if isinstance(event_categories, fields.FieldInfo):
-        event_categories = None
-
     params = {
         'SourceIdentifier': source_identifier,
         'SourceType': source_type,
@@ -195,7 +206,7 @@ def describe_rds_events(
     raw_events = response.get('Events', [])
     processed_events = [Event.from_event_data(event) for event in raw_events]
 
-    return EventList(
+    return EventList.model_construct(
         events=processed_events,
         count=len(processed_events),
         source_identifier=source_identifier,
@@ -14,20 +14,35 @@
 
 """describe_rds_performance_metrics helpers, data models and tool implementation."""
 
+import asyncio
+from ...common.concurrency import run_in_io_executor
 from ...common.connection import CloudwatchConnectionManager
 from ...common.context import RDSContext
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.server import mcp
-from ...common.utils import handle_paginated_aws_api_call
+from ...common.utils import handle_paginated_aws_api_call, parse_iso_datetime
 from datetime import datetime
+from functools import lru_cache
 from mcp.types import ToolAnnotations
 from mypy_boto3_cloudwatch.literals import StatusCodeType
-from mypy_boto3_cloudwatch.type_defs import MetricDataResultTypeDef
+from mypy_boto3_cloudwatch.type_defs import MetricDataQueryTypeDef, MetricDataResultTypeDef
 from pydantic import BaseModel, Field
-from statistics import mean
-from typing import List, Literal
+from statistics import fmean
+from typing import Annotated, Any, Dict, List, Literal, Sequence, Tuple
 
 
+# GetMetricData accepts at most 500 metric data queries per request
+MAX_METRIC_DATA_QUERIES = 500
+
+# Statistics reported for metrics that returned no data points
+_EMPTY_SUMMARY_STATS = {
+    'current_value': 0.0,
+    'min_value': 0.0,
+    'max_value': 0.0,
+    'avg_value': 0.0,
+    'data_points_count': 0,
+}
+
 METRICS = {
     'INSTANCE': [
         'BurstBalance',
@@ -64,6 +79,104 @@ METRICS = {
 }
 
 
+@lru_cache(maxsize=256)
+def _build_metric_queries(
+    resource_type: str,
+    resource_identifier: str,
+    period: int,
+    stat: str,
+) -> Tuple[Dict[str, Any], ...]:
+    """Build and memoize the CloudWatch metric data queries for a given signature.
+
+    Monitoring workloads tend to poll the same resource with the same settings, so each
+    query set is only constructed once per signature.
+    """
+    dimension_name = (
+        'DBInstanceIdentifier' if resource_type == 'INSTANCE' else 'DBClusterIdentifier'
+    )
+    dimensions = [{'Name': dimension_name, 'Value': resource_identifier}]
+
+    return tuple(
+        {
+            'Id': f'metric_{metric}_{stat}',
+            'MetricStat': {
+                'Metric': {
+                    'Namespace': 'AWS/RDS',
+                    'MetricName': metric,
+                    'Dimensions': dimensions,
+                },
+                'Period': period,
+                'Stat': stat,
+            },
+            'ReturnData': True,
+        }
+        for metric in METRICS[resource_type]
+    )
+
+
+def build_metric_queries(
+    resource_type: str,
+    resource_identifier: str,
+    period: int,
+    stat: str,
+) -> List[MetricDataQueryTypeDef]:
+    """Build the CloudWatch metric data queries for an RDS resource.
+
+    Args:
+        resource_type: Type of RDS resource (INSTANCE, CLUSTER or GLOBAL_CLUSTER)
+        resource_identifier: The DBInstanceIdentifier or DBClusterIdentifier of the resource
+        period: The granularity, in seconds, of the returned datapoints
+        stat: The statistic to retrieve for each metric
+
+    Returns:
+        List of metric data queries, one per metric of the resource type
+    """
+    return list(_build_metric_queries(resource_type, resource_identifier, period, stat))
+
+
+def _sample_indices(values: List[float], max_points: int) -> Sequence[int]:
+    """Select the positions of the representative data points of a chronological series.
+
+    Long series are reduced with min/max bucketing: the first and last points are always
+    kept, and the points in between are split into equal buckets from which the lowest
+    and highest values are taken. Unlike taking every k-th point, this preserves the
+    spikes and dips that matter when diagnosing performance issues.
+
+    Args:
+        values: The metric values in chronological order
+        max_points: The maximum number of positions to return
+
+    Returns:
+        The selected positions in ascending order
+    """
+    count = len(values)
+    if count <= max_points:
+        return range(count)
+    if max_points < 4:
+        # Too few points for buckets, so fall back to evenly spaced positions
+        if max_points == 1:
+            return [count - 1]
+        return [i * (count - 1) // (max_points - 1) for i in range(max_points)]
+
+    buckets = (max_points - 2) // 2
+    inner = count - 2
+    indices = [0]
+    for bucket in range(buckets):
+        start = 1 + bucket * inner // buckets
+        end = 1 + (bucket + 1) * inner // buckets
+        # min() and max() run over a plain slice without a key, and index() then locates
+        # the first occurrence of each within the bucket
+        bucket_values = values[start:end]
+        low = values.index(min(bucket_values), start, end)
+        high = values.index(max(bucket_values), start, end)
+        if low == high:
+            indices.append(low)
+        else:
+            indices.extend((low, high) if low < high else (high, low))
+    indices.append(count - 1)
+    return indices
+
+
 class DataPoint(BaseModel):
     """Single metric data point with timestamp."""
 
@@ -87,7 +200,7 @@ class MetricSummary(BaseModel):
     data_points_count: int = Field(..., description='Total number of data points available')
     sample_data_points: List[DataPoint] = Field(
         ...,
-        description='Representative data points with timestamps for analysis, including first and last points plus evenly distributed samples',
+        description='Representative data points with timestamps for analysis, including first and last points plus the lowest and highest values of evenly sized intervals',
     )
 
     @classmethod
@@ -99,58 +212,37 @@ class MetricSummary(BaseModel):
         Returns:
             MetricSummary: Object containing summarized metric data
         """
+        # The data comes straight from a typed CloudWatch response, so the summary and its
+        # data points are assembled with model_construct to skip per-field validation
         values = metric_data.get('Values', [])
         timestamps = metric_data.get('Timestamps', [])
         status = metric_data.get('StatusCode', 'Complete')
         if not values:
-            return cls(
+            return cls.model_construct(
                 id=metric_data.get('Id', ''),
                 label=metric_data.get('Label', ''),
                 data_status=status,
-                current_value=0,
-                min_value=0,
-                max_value=0,
-                avg_value=0,
-                data_points_count=0,
                 sample_data_points=[],
+                **_EMPTY_SUMMARY_STATS,
             )
 
-        min_val, max_val, avg_val = min(values), max(values), mean(values)
-        current_val = values[0] if timestamps and timestamps[0] > timestamps[-1] else values[-1]
-
-        data_with_timestamps = list(zip(timestamps, values))
-        data_with_timestamps.sort(key=lambda x: x[0])
-
-        max_data_points = RDSContext.max_items()
-        sample_data_points = []
+        min_val, max_val, avg_val = min(values), max(values), fmean(values)
+        descending = bool(timestamps) and timestamps[0] > timestamps[-1]
+        current_val = values[0] if descending else values[-1]
 
-        if len(data_with_timestamps) <= max_data_points:
-            sample_data_points = [
-                DataPoint(timestamp=ts, value=round(val, 2)) for ts, val in data_with_timestamps
-            ]
-        else:
-            step = len(data_with_timestamps) // max_data_points
-            sample_data_points = [
-                DataPoint(
-                    timestamp=data_with_timestamps[i][0],
-                    value=round(data_with_timestamps[i][1], 2),
-                )
-                for i in range(0, len(data_with_timestamps), step)[:max_data_points]
-            ]
-
-            first_point = DataPoint(
-                timestamp=data_with_timestamps[0][0], value=round(data_with_timestamps[0][1], 2)
-            )
-            last_point = DataPoint(
-                timestamp=data_with_timestamps[-1][0], value=round(data_with_timestamps[-1][1], 2)
-            )
+        # CloudWatch returns the points already ordered by ScanBy, so they only need to be
+        # reversed (not sorted) to put them in chronological order
+        if descending:
+            timestamps = timestamps[::-1]
+            values = values[::-1]
 
-            if sample_data_points and sample_data_points[0].timestamp != first_point.timestamp:
-                sample_data_points.insert(0, first_point)
-            if sample_data_points and sample_data_points[-1].timestamp != last_point.timestamp:
-                sample_data_points.append(last_point)
+        indices = _sample_indices(values, RDSContext.max_items())
+        sample_data_points = [
+            DataPoint.model_construct(timestamp=timestamps[i], value=round(values[i], 2))
+            for i in indices
+        ]
 
-        return cls(
+        return cls.model_construct(
             id=metric_data.get('Id', ''),
             label=metric_data.get('Label', ''),
             data_status=status,
@@ -186,35 +278,49 @@ This tool fetches detailed performance metrics for Amazon RDS resources includin
     ),
 )
 @handle_exceptions
-def describe_rds_performance_metrics(
-    resource_identifier: str = Field(
-        ...,
-        description='The identifier of the RDS resource (DBInstanceIdentifier or DBClusterIdentifier)',
-    ),
-    resource_type: Literal['INSTANCE', 'CLUSTER', 'GLOBAL_CLUSTER'] = Field(
-        ...,
-        description='Type of RDS resource to fetch metrics for (instance, cluster, or global_cluster)',
-    ),
-    start_date: str = Field(
-        ...,
-        description='The start time for the metrics query in ISO 8601 format (e.g., 2025-06-01T00:00:00Z)',
-    ),
-    end_date: str = Field(
-        ...,
-        description='The end time for the metrics query in ISO 8601 format (e.g., 2025-06-29T00:00:00Z)',
-    ),
-    period: int = Field(
-        ...,
-        description='The granularity, in seconds, of the returned datapoints (e.g., 60 for per-minute data)',
-    ),
-    stat: Literal['SampleCount', 'Sum', 'Average', 'Minimum', 'Maximum'] = Field(
-        ...,
-        description='The statistic to retrieve for the specified metric (SampleCount, Sum, Average, Minimum, or Maximum)',
-    ),
-    scan_by: Literal['TimestampDescending', 'TimestampAscending'] = Field(
-        ...,
-        description='The order to scan the results by timestamp (newest first or oldest first)',
-    ),
+async def describe_rds_performance_metrics(
+    resource_identifier: Annotated[
+        str,
+        Field(
+            description='The identifier of the RDS resource (DBInstanceIdentifier or DBClusterIdentifier)',
+        ),
+    ],
+    resource_type: Annotated[
+        Literal['INSTANCE', 'CLUSTER', 'GLOBAL_CLUSTER'],
+        Field(
+            description='Type of RDS resource to fetch metrics for (instance, cluster, or global_cluster)',
+        ),
+    ],
+    start_date: Annotated[
+        str,
+        Field(
+            description='The start time for the metrics query in ISO 8601 format (e.g., 2025-06-01T00:00:00Z)',
+        ),
+    ],
+    end_date: Annotated[
+        str,
+        Field(
+            description='The end time for the metrics query in ISO 8601 format (e.g., 2025-06-29T00:00:00Z)',
+        ),
+    ],
+    period: Annotated[
+        int,
+        Field(
+            description='The granularity, in seconds, of the returned datapoints (e.g., 60 for per-minute data)',
+        ),
+    ],
+    stat: Annotated[
+        Literal['SampleCount', 'Sum', 'Average', 'Minimum', 'Maximum'],
+        Field(
+            description='The statistic to retrieve for the specified metric (SampleCount, Sum, Average, Minimum, or Maximum)',
+        ),
+    ],
+    scan_by: Annotated[
+        Literal['TimestampDescending', 'TimestampAscending'],
+        Field(
+            description='The order to scan the results by timestamp (newest first or oldest first)',
+        ),
+    ],
 ) -> MetricSummaryList:
     """Retrieve performance metrics for RDS resources.
 
@@ -230,54 +336,37 @@ def describe_rds_performance_metrics(
     Returns:
         MetricSummaryList: Performance metrics with statistical summaries and raw data points
     """
-    start = (
-        datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-        if start_date.endswith('Z')
-        else datetime.fromisoformat(start_date)
-    )
-    end = (
-        datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-        if end_date.endswith('Z')
-        else datetime.fromisoformat(end_date)
-    )
-
-    dimension_name = (
-        'DBInstanceIdentifier' if resource_type == 'INSTANCE' else 'DBClusterIdentifier'
-    )
+    start = parse_iso_datetime(start_date)
+    end = parse_iso_datetime(end_date)
 
-    metrics = METRICS[resource_type]
+    metric_queries = build_metric_queries(resource_type, resource_identifier, period, stat)
+    cloudwatch_client = CloudwatchConnectionManager.get_connection()
 
-    metric_queries = [
-        {
-            'Id': f'metric_{metric}_{stat}',
-            'MetricStat': {
-                'Metric': {
-                    'Namespace': 'AWS/RDS',
-                    'MetricName': metric,
-                    'Dimensions': [{'Name': dimension_name, 'Value': resource_identifier}],
-                },
-                'Period': period,
-                'Stat': stat,
+    def fetch_metric_summaries(queries: List[MetricDataQueryTypeDef]) -> List[MetricSummary]:
+        return handle_paginated_aws_api_call(
+            client=cloudwatch_client,
+            paginator_name='get_metric_data',
+            operation_parameters={
+                'MetricDataQueries': queries,
+                'StartTime': start,
+                'EndTime': end,
+                'ScanBy': scan_by,
+                'PaginationConfig': RDSContext.get_pagination_config(),
             },
-            'ReturnData': True,
-        }
-        for metric in metrics
-    ]
-    cloudwatch_client = CloudwatchConnectionManager.get_connection()
+            format_function=MetricSummary.from_metric_data,
+            result_key='MetricDataResults',
+        )
 
-    results = handle_paginated_aws_api_call(
-        client=cloudwatch_client,
-        paginator_name='get_metric_data',
-        operation_parameters={
-            'MetricDataQueries': metric_queries,
-            'StartTime': start,
-            'EndTime': end,
-            'ScanBy': scan_by,
-            'PaginationConfig': RDSContext.get_pagination_config(),
-        },
-        format_function=MetricSummary.from_metric_data,
-        result_key='MetricDataResults',
+    query_batches = [
+        metric_queries[i : i + MAX_METRIC_DATA_QUERIES]
+        for i in range(0, len(metric_queries), MAX_METRIC_DATA_QUERIES)
+    ]
+    # Page through the batches on the I/O pool so the event loop is not blocked, running
+    # independent batches concurrently
+    batch_results = await asyncio.gather(
+        *[run_in_io_executor(fetch_metric_summaries, batch) for batch in query_batches]
     )
+    results = [summary for batch in batch_results for summary in batch]
 
     return MetricSummaryList(
         metrics=results,
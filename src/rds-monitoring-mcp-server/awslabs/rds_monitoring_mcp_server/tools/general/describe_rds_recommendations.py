@@ -14,6 +14,8 @@
 
 """describe_rds_recommendations helpers, data models and tool implementation."""
 
+import time
+from ...common.concurrency import run_in_io_executor
 from ...common.connection import RDSConnectionManager
 from ...common.decorators.handle_exceptions import handle_exceptions
 from ...common.server import mcp
@@ -22,7 +24,7 @@ from datetime import datetime
 from mcp.types import ToolAnnotations
 from mypy_boto3_rds.type_defs import DBRecommendationTypeDef
 from pydantic import BaseModel, Field
-from typing import List, Literal, Optional
+from typing import Annotated, Dict, List, Literal, Optional, Tuple
 
 
 class DBRecommendationList(BaseModel):
@@ -34,9 +36,65 @@ class DBRecommendationList(BaseModel):
     count: int = Field(..., description='The number of recommendations.')
 
 
+# API filter names, in the order of the matching tool arguments
+FILTER_NAMES = ('status', 'severity', 'cluster-resource-id', 'dbi-resource-id')
+
+# Agents tend to repeat the same query several times while investigating an issue,
+# so recent results are served from memory for a short time
+RESULT_CACHE_TTL_SECONDS = 30
+RESULT_CACHE_MAX_ENTRIES = 64
+
+_RESULT_CACHE: Dict[Tuple, Tuple[float, DBRecommendationList]] = {}
+
+
+def get_cached_result(key: Tuple) -> Optional[DBRecommendationList]:
+    """Get a recent result for the given query, if it has not expired yet.
+
+    Args:
+        key: The tuple of filter arguments identifying the query
+
+    Returns:
+        A copy of the cached result, or None if there is no result younger than
+        RESULT_CACHE_TTL_SECONDS
+    """
+    entry = _RESULT_CACHE.get(key)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if time.monotonic() >= expires_at:
+        _RESULT_CACHE.pop(key, None)
+        return None
+    # Every caller gets its own copy so that changes to one response never leak into another
+    return result.model_copy(deep=True)
+
+
+def cache_result(key: Tuple, result: DBRecommendationList) -> None:
+    """Store a copy of a result for the given query.
+
+    When the cache is full, expired entries are purged first and the oldest live entry is
+    only evicted if that does not free any space.
+
+    Args:
+        key: The tuple of filter arguments identifying the query
+        result: The result to cache
+    """
+    now = time.monotonic()
+    if key not in _RESULT_CACHE and len(_RESULT_CACHE) >= RESULT_CACHE_MAX_ENTRIES:
+        expired = [
+            cached_key
+            for cached_key, (expires_at, _) in _RESULT_CACHE.items()
+            if now >= expires_at
+        ]
+        for cached_key in expired:
+            del _RESULT_CACHE[cached_key]
+        if len(_RESULT_CACHE) >= RESULT_CACHE_MAX_ENTRIES:
+            _RESULT_CACHE.pop(next(iter(_RESULT_CACHE)), None)
+    _RESULT_CACHE[key] = (now + RESULT_CACHE_TTL_SECONDS, result.model_copy(deep=True))
+
+
 # MCP Tool Args
 
-TOOL_DESCRIPTION = """Get RDS recommendations.
+TOOL_DESCRIPTION = f"""Get RDS recommendations.
 
     This tool retrieves recommendations for RDS resources such as DB instances and clusters.
     Recommendations include operational suggestions, performance improvements, and best practices
@@ -53,6 +111,7 @@ TOOL_DESCRIPTION = """Get RDS recommendations.
     2. Time-based filters use ISO8601 format (e.g., '2025-06-01T00:00:00Z')
     3. Recommendations are categorized by severity to help prioritize actions
     4. Each recommendation includes detailed descriptions and specific actions to take
+    5. Identical queries within {RESULT_CACHE_TTL_SECONDS} seconds return the previous result without calling AWS again
     </important_notes>
 
     Args:
@@ -96,26 +155,32 @@ TOOL_DESCRIPTION = """Get RDS recommendations.
 )
 @handle_exceptions
 async def describe_rds_recommendations(
-    last_updated_after: Optional[str] = Field(
-        None,
-        description='Filter to include recommendations updated after this time (ISO8601 format)',
-    ),
-    last_updated_before: Optional[str] = Field(
-        None,
-        description='Filter to include recommendations updated before this time (ISO8601 format)',
-    ),
-    status: Optional[Literal['active', 'pending', 'resolved', 'dismissed']] = Field(
-        None, description='Filter by recommendation status'
-    ),
-    severity: Optional[Literal['high', 'medium', 'low', 'informational']] = Field(
-        None, description='Filter by recommendation severity'
-    ),
-    cluster_resource_id: Optional[str] = Field(
-        None, description='Filter by cluster resource identifier'
-    ),
-    dbi_resource_id: Optional[str] = Field(
-        None, description='Filter by database instance resource identifier'
-    ),
+    last_updated_after: Annotated[
+        Optional[str],
+        Field(
+            description='Filter to include recommendations updated after this time (ISO8601 format)',
+        ),
+    ] = None,
+    last_updated_before: Annotated[
+        Optional[str],
+        Field(
+            description='Filter to include recommendations updated before this time (ISO8601 format)',
+        ),
+    ] = None,
+    status: Annotated[
+        Optional[Literal['active', 'pending', 'resolved', 'dismissed']],
+        Field(description='Filter by recommendation status'),
+    ] = None,
+    severity: Annotated[
+        Optional[Literal['high', 'medium', 'low', 'informational']],
+        Field(description='Filter by recommendation severity'),
+    ] = None,
+    cluster_resource_id: Annotated[
+        Optional[str], Field(description='Filter by cluster resource identifier')
+    ] = None,
+    dbi_resource_id: Annotated[
+        Optional[str], Field(description='Filter by database instance resource identifier')
+    ] = None,
 ) -> DBRecommendationList:
     """Retrieve RDS recommendations and convert them to simplified models suitable for LLM summarization and insights.
 
@@ -132,38 +197,51 @@ async def describe_rds_recommendations(
     Returns:
         DBRecommendationList: A model containing the list of recommendations designed for LLM processing
     """
+    cache_key = (
+        last_updated_after,
+        last_updated_before,
+        status,
+        severity,
+        cluster_resource_id,
+        dbi_resource_id,
+    )
+    cached = get_cached_result(cache_key)
+    if cached is not None:
+        return cached
+
     params = {}
+    now = datetime.now()
     if last_updated_after:
-        params['LastUpdatedAfter'] = convert_string_to_datetime(datetime.now(), last_updated_after)
+        params['LastUpdatedAfter'] = convert_string_to_datetime(now, last_updated_after)
     if last_updated_before:
-        params['LastUpdatedBefore'] = convert_string_to_datetime(
-            datetime.now(), last_updated_before
-        )
-
-    filters = []
-    if status:
-        filters.append({'Name': 'status', 'Values': [status]})
-    if severity:
-        filters.append({'Name': 'severity', 'Values': [severity]})
-    if cluster_resource_id:
-        filters.append({'Name': 'cluster-resource-id', 'Values': [cluster_resource_id]})
-    if dbi_resource_id:
-        filters.append({'Name': 'dbi-resource-id', 'Values': [dbi_resource_id]})
+        params['LastUpdatedBefore'] = convert_string_to_datetime(now, last_updated_before)
+
+    filter_values = (status, severity, cluster_resource_id, dbi_resource_id)
+    filters = [
+        {'Name': name, 'Values': [value]}
+        for name, value in zip(FILTER_NAMES, filter_values)
+        if value
+    ]
 
     if filters:
         params['Filters'] = filters
 
     rds_client = RDSConnectionManager.get_connection()
 
-    recommendations = handle_paginated_aws_api_call(
+    # The pages are token-chained and cannot be fetched concurrently, so run the whole
+    # pagination on the I/O pool to keep the event loop free for other requests.
+    recommendations = await run_in_io_executor(
+        handle_paginated_aws_api_call,
         client=rds_client,
         paginator_name='describe_db_recommendations',
         operation_parameters=params,
         result_key='DBRecommendations',
     )
 
-    recommendation_list = DBRecommendationList(
+    # The recommendations come straight from boto3, so skip validating every nested TypedDict
+    recommendation_list = DBRecommendationList.model_construct(
         recommendations=recommendations, count=len(recommendations)
     )
+    cache_result(cache_key, recommendation_list)
 
     return recommendation_list
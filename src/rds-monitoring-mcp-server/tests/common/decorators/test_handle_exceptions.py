@@ -15,13 +15,11 @@
 """Tests for the handle_exceptions decorator in the RDS Monitoring MCP Server."""
 
 import json
-import pytest
 from awslabs.rds_monitoring_mcp_server.common.decorators.handle_exceptions import handle_exceptions
 from botocore.exceptions import ClientError
 from unittest.mock import patch
 
 
-@pytest.mark.asyncio
 async def test_handle_exceptions_success_async():
     """Test that the decorator passes through successful async function calls."""
 
@@ -33,7 +31,6 @@ async def test_handle_exceptions_success_async():
     assert result == 'success'
 
 
-@pytest.mark.asyncio
 async def test_handle_exceptions_success_sync():
     """Test that the decorator passes through successful sync function calls."""
 
@@ -45,7 +42,6 @@ async def test_handle_exceptions_success_sync():
     assert result == 'success'
 
 
-@pytest.mark.asyncio
 async def test_handle_exceptions_client_error():
     """Test that the decorator handles ClientError exceptions."""
     error_response = {
@@ -66,7 +62,6 @@ async def test_handle_exceptions_client_error():
     assert result_dict['operation'] == 'test_func'
 
 
-@pytest.mark.asyncio
 async def test_handle_exceptions_general_error():
     """Test that the decorator handles general exceptions."""
 
@@ -84,7 +79,6 @@ async def test_handle_exceptions_general_error():
     assert result_dict['operation'] == 'test_func'
 
 
-@pytest.mark.asyncio
 async def test_handle_exceptions_with_args_kwargs():
     """Test that the decorator preserves function arguments."""
 
@@ -96,7 +90,6 @@ async def test_handle_exceptions_with_args_kwargs():
     assert result == 'a-b-c'
 
 
-@pytest.mark.asyncio
 async def test_handle_exceptions_async_client_error():
     """Test that the decorator handles ClientError in async functions."""
     error_response = {'Error': {'Code': 'AccessDenied', 'Message': 'Access denied'}}
@@ -113,3 +106,20 @@ async def test_handle_exceptions_async_client_error():
     assert result_dict['error_code'] == 'AccessDenied'
     assert result_dict['error_message'] == 'Access denied'
     assert result_dict['operation'] == 'test_func'
+
+
+async def test_handle_exceptions_client_error_without_details():
+    """Test that the decorator handles a ClientError response without error details."""
+
+    @handle_exceptions
+    def test_func():
+        raise ClientError({}, 'TestOperation')
+
+    with patch('awslabs.rds_monitoring_mcp_server.common.decorators.handle_exceptions.logger'):
+        result = await test_func()
+
+    result_dict = json.loads(result)
+    assert result_dict['error'] == 'AWS API error: Unknown'
+    assert result_dict['error_code'] == 'Unknown'
+    assert result_dict['error_message'] == 'Unknown'
+    assert result_dict['operation'] == 'test_func'
@@ -15,7 +15,10 @@
 """Tests for the rate_limiter decorator."""
 
 import pytest
-from awslabs.rds_monitoring_mcp_server.common.decorators.rate_limit import rate_limiter
+from awslabs.rds_monitoring_mcp_server.common.decorators.rate_limit import (
+    rate_limiter,
+    try_acquire,
+)
 from collections import defaultdict, deque
 from unittest.mock import patch
 
@@ -33,7 +36,6 @@ def clean_call_times():
 class TestRateLimiter:
     """Tests for the rate_limiter decorator."""
 
-    @pytest.mark.asyncio
     async def test_allows_calls_within_limit(self, clean_call_times):
         """Test that rate limiter allows calls within the limit."""
 
@@ -45,7 +47,6 @@ class TestRateLimiter:
             result = await test_func()
             assert result == 'success'
 
-    @pytest.mark.asyncio
     async def test_blocks_calls_over_limit(self, clean_call_times):
         """Test that rate limiter blocks calls over the limit."""
 
@@ -61,7 +62,6 @@ class TestRateLimiter:
         ):
             await test_func()
 
-    @pytest.mark.asyncio
     async def test_cleans_up_expired_calls(self):
         """Test that rate limiter cleans up expired calls."""
         with patch(
@@ -82,7 +82,6 @@ class TestRateLimiter:
                 result = await test_func()
                 assert result == 'success'
 
-    @pytest.mark.asyncio
     async def test_preserves_function_metadata(self):
         """Test that rate limiter preserves function metadata."""
 
@@ -94,7 +93,6 @@ class TestRateLimiter:
         assert test_func.__name__ == 'test_func'
         assert test_func.__doc__ == 'Test docstring.'
 
-    @pytest.mark.asyncio
     async def test_handles_function_arguments(self, clean_call_times):
         """Test that rate limiter handles function arguments."""
 
@@ -105,7 +103,6 @@ class TestRateLimiter:
         result = await test_func('a', 'b', kwarg1='c')
         assert result == 'a-b-c'
 
-    @pytest.mark.asyncio
     async def test_tracks_functions_separately(self, clean_call_times):
         """Test that rate limiter tracks different functions separately."""
 
@@ -125,3 +122,18 @@ class TestRateLimiter:
             await func1()
         with pytest.raises(Exception):
             await func2()
+
+    async def test_try_acquire_shares_the_decorator_budget(self, clean_call_times):
+        """Test that try_acquire draws on the same budget as the decorated function."""
+
+        @rate_limiter
+        async def test_func():
+            return 'success'
+
+        await test_func()
+
+        assert try_acquire('test_func') is True
+        assert try_acquire('test_func') is True
+        assert try_acquire('test_func') is False
+        with pytest.raises(Exception, match='Rate limit exceeded'):
+            await test_func()
@@ -0,0 +1,44 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the shared I/O thread pool."""
+
+import asyncio
+import pytest
+import threading
+from awslabs.rds_monitoring_mcp_server.common.concurrency import run_in_io_executor
+
+
+async def test_run_in_io_executor_returns_result():
+    """Test that arguments are forwarded and the result is returned."""
+    result = await run_in_io_executor(lambda a, b=0: a + b, 1, b=2)
+    assert result == 3
+
+
+async def test_run_in_io_executor_uses_shared_pool():
+    """Test that calls run on the named worker threads of the shared pool."""
+    names = await asyncio.gather(
+        *[run_in_io_executor(lambda: threading.current_thread().name) for _ in range(3)]
+    )
+    assert all(name.startswith('rds-mcp-io') for name in names)
+
+
+async def test_run_in_io_executor_propagates_exceptions():
+    """Test that exceptions raised by the function are re-raised on await."""
+
+    def fail():
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError, match='boom'):
+        await run_in_io_executor(fail)
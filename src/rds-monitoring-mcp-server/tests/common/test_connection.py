@@ -54,6 +54,7 @@ def test_get_connection_default_settings(conn_manager):
         assert client_args['service_name'] == conn_manager._service_name
         config = client_args['config']
         assert isinstance(config, Config)
+        assert config.max_pool_connections == 50
 
         assert client == mock_client
 
@@ -64,6 +65,7 @@ def test_get_connection_custom_settings(conn_manager):
     env_vars = {
         'AWS_PROFILE': 'test-profile',
         'AWS_REGION': 'us-west-2',
+        f'{conn_manager._env_prefix}_MAX_POOL_CONNECTIONS': '20',
     }
 
     with patch.dict(os.environ, env_vars), patch('boto3.Session') as mock_session:
@@ -74,6 +76,8 @@ def test_get_connection_custom_settings(conn_manager):
 
         mock_session.assert_called_once_with(profile_name='test-profile', region_name='us-west-2')
         mock_session.return_value.client.assert_called_once()
+        config = mock_session.return_value.client.call_args[1]['config']
+        assert config.max_pool_connections == 20
 
         assert client == mock_client
 
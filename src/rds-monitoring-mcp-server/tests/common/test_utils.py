@@ -14,11 +14,15 @@
 
 """Tests for the utilities in utils.py."""
 
+import pytest
 from awslabs.rds_monitoring_mcp_server.common.utils import (
     convert_datetime_to_string,
     convert_string_to_datetime,
+    get_paginator,
+    parse_iso_datetime,
 )
-from datetime import datetime
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
 
 
 class TestConvertDatetimeToString:
@@ -153,3 +157,61 @@ class TestConvertStringToDatetime:
 
         result = convert_string_to_datetime(default, date_string)
         assert result == default
+
+    def test_repeated_date_string_is_cached(self):
+        """Test that repeated date strings are only parsed once."""
+        default = datetime(2025, 6, 15, 10, 30, 45)
+
+        first = convert_string_to_datetime(default, '2025-07-20T14:30:00Z')
+        second = convert_string_to_datetime(default, '2025-07-20T14:30:00Z')
+
+        # A memoized parse hands back the very same datetime object
+        assert first is second
+
+
+class TestParseIsoDatetime:
+    """Tests for parse_iso_datetime function."""
+
+    def test_parse_utc_suffix(self):
+        """Test parsing a timestamp with a trailing Z."""
+        result = parse_iso_datetime('2025-06-01T00:00:00Z')
+        assert result == datetime(2025, 6, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+    def test_parse_offset(self):
+        """Test parsing a timestamp with an explicit offset."""
+        result = parse_iso_datetime('2025-06-01T00:00:00+00:00')
+        assert result == datetime(2025, 6, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+    @pytest.mark.parametrize('date_string', ['06/01/2025', '1748736000', 'invalid-date-format'])
+    def test_non_iso_format_raises(self, date_string):
+        """Test that formats accepted by convert_string_to_datetime are rejected."""
+        with pytest.raises(ValueError):
+            parse_iso_datetime(date_string)
+
+
+class TestGetPaginator:
+    """Tests for get_paginator function."""
+
+    def test_reuses_paginator_per_client(self):
+        """Test paginators are built once per client and operation."""
+        client = MagicMock()
+        client.get_paginator.side_effect = lambda name: MagicMock(name=name)
+
+        first = get_paginator(client, 'describe_db_instances')
+        second = get_paginator(client, 'describe_db_instances')
+        other = get_paginator(client, 'describe_db_clusters')
+
+        assert first is second
+        assert other is not first
+        assert client.get_paginator.call_count == 2
+
+    def test_separate_clients_do_not_share_paginators(self):
+        """Test a new client gets its own paginator, e.g. after the connection is reset."""
+        old_client = MagicMock()
+        new_client = MagicMock()
+
+        get_paginator(old_client, 'describe_db_instances')
+        paginator = get_paginator(new_client, 'describe_db_instances')
+
+        assert paginator is new_client.get_paginator.return_value
+        new_client.get_paginator.assert_called_once_with('describe_db_instances')
@@ -27,6 +27,15 @@ def mock_rds_client():
     RDSConnectionManager._client = None
 
 
+@pytest.fixture
+def mock_rds_paginator(mock_rds_client):
+    """Fixture providing the paginator returned by the mock RDS client.
+
+    Set paginate.return_value to the list of pages the paginator should yield.
+    """
+    return mock_rds_client.get_paginator.return_value
+
+
 @pytest.fixture
 def mock_pi_client():
     """Fixture providing a mock PI (Performance Insights) client for tests.
@@ -20,66 +20,56 @@ from awslabs.rds_monitoring_mcp_server.resources.db_cluster.list_clusters import
     list_clusters,
 )
 from typing import Any
-from unittest.mock import MagicMock
 
 
 class TestListClusters:
     """Test list_clusters function."""
 
-    @pytest.mark.asyncio
-    async def test_success(self, mock_rds_client):
-        """Test successful cluster list retrieval."""
-        mock_paginator = MagicMock()
-        mock_rds_client.get_paginator.return_value = mock_paginator
-        mock_paginator.paginate.return_value = [
-            {
-                'DBClusters': [
+    @pytest.mark.parametrize(
+        'pages, expected_ids',
+        [
+            (
+                [
                     {
-                        'DBClusterIdentifier': 'test-cluster-1',
-                        'Status': 'available',
-                        'Engine': 'aurora-mysql',
-                        'MultiAZ': True,
-                    },
-                    {
-                        'DBClusterIdentifier': 'test-cluster-2',
-                        'Status': 'available',
-                        'Engine': 'aurora-postgresql',
-                        'MultiAZ': False,
-                    },
-                ]
-            }
-        ]
-
-        result = await list_clusters()
-
-        assert result.count == 2
-        assert len(result.clusters) == 2
-        assert result.clusters[0].cluster_id == 'test-cluster-1'
-        assert result.clusters[1].cluster_id == 'test-cluster-2'
-
-    @pytest.mark.asyncio
-    async def test_empty_response(self, mock_rds_client):
-        """Test handling of empty cluster response."""
-        mock_paginator = MagicMock()
-        mock_rds_client.get_paginator.return_value = mock_paginator
-        mock_paginator.paginate.return_value = [{'DBClusters': []}]
+                        'DBClusters': [
+                            {
+                                'DBClusterIdentifier': 'test-cluster-1',
+                                'Status': 'available',
+                                'Engine': 'aurora-mysql',
+                                'MultiAZ': True,
+                            },
+                            {
+                                'DBClusterIdentifier': 'test-cluster-2',
+                                'Status': 'available',
+                                'Engine': 'aurora-postgresql',
+                                'MultiAZ': False,
+                            },
+                        ]
+                    }
+                ],
+                ['test-cluster-1', 'test-cluster-2'],
+            ),
+            ([{'DBClusters': []}], []),
+        ],
+        ids=['success', 'empty_response'],
+    )
+    async def test_list_clusters(self, mock_rds_paginator, pages, expected_ids):
+        """Test cluster list retrieval for populated and empty responses."""
+        mock_rds_paginator.paginate.return_value = pages
 
         result = await list_clusters()
 
-        assert result.count == 0
-        assert len(result.clusters) == 0
+        assert result.count == len(expected_ids)
+        assert [cluster.cluster_id for cluster in result.clusters] == expected_ids
 
-    @pytest.mark.asyncio
-    async def test_calls_api_with_correct_parameters(self, mock_rds_client):
+    async def test_calls_api_with_correct_parameters(self, mock_rds_client, mock_rds_paginator):
         """Test API is called with correct parameters."""
-        mock_paginator = MagicMock()
-        mock_rds_client.get_paginator.return_value = mock_paginator
-        mock_paginator.paginate.return_value = [{'DBClusters': []}]
+        mock_rds_paginator.paginate.return_value = [{'DBClusters': []}]
 
         await list_clusters()
 
         mock_rds_client.get_paginator.assert_called_once_with('describe_db_clusters')
-        mock_paginator.paginate.assert_called_once_with(PaginationConfig={'MaxItems': 100})
+        mock_rds_paginator.paginate.assert_called_once_with(PaginationConfig={'MaxItems': 100})
 
 
 class TestClusterSummary:
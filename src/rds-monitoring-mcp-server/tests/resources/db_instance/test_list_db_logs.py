@@ -26,38 +26,34 @@ from unittest.mock import patch
 class TestListDBLogFiles:
     """Test list_db_log_files function."""
 
-    @pytest.mark.asyncio
-    async def test_success(self, mock_rds_client):
-        """Test successful log file retrieval."""
-        mock_log_file = DBLogFileSummary(
-            log_file_name='error/mysql-error.log',
-            last_written=datetime(2024, 1, 1, 12, 0, 0),
-            size=1024,
-        )
-
-        with patch(
-            'awslabs.rds_monitoring_mcp_server.resources.db_instance.list_db_logs.handle_paginated_aws_api_call'
-        ) as mock_call:
-            mock_call.return_value = [mock_log_file]
-
-            result = await list_db_log_files(db_instance_identifier='test-instance')
-
-        assert result.count == 1
-        assert len(result.log_files) == 1
-        assert result.log_files[0].log_file_name == 'error/mysql-error.log'
-
-    @pytest.mark.asyncio
-    async def test_empty_response(self, mock_rds_client):
-        """Test handling of empty log file response."""
+    @pytest.mark.parametrize(
+        'log_files, expected_names',
+        [
+            (
+                [
+                    DBLogFileSummary(
+                        log_file_name='error/mysql-error.log',
+                        last_written=datetime(2024, 1, 1, 12, 0, 0),
+                        size=1024,
+                    )
+                ],
+                ['error/mysql-error.log'],
+            ),
+            ([], []),
+        ],
+        ids=['success', 'empty_response'],
+    )
+    async def test_list_db_log_files(self, mock_rds_client, log_files, expected_names):
+        """Test log file retrieval for populated and empty responses."""
         with patch(
             'awslabs.rds_monitoring_mcp_server.resources.db_instance.list_db_logs.handle_paginated_aws_api_call'
         ) as mock_call:
-            mock_call.return_value = []
+            mock_call.return_value = log_files
 
             result = await list_db_log_files(db_instance_identifier='test-instance')
 
-        assert result.count == 0
-        assert len(result.log_files) == 0
+        assert result.count == len(expected_names)
+        assert [log_file.log_file_name for log_file in result.log_files] == expected_names
 
 
 class TestDBLogFileSummary:
@@ -20,72 +20,61 @@ from awslabs.rds_monitoring_mcp_server.resources.db_instance.list_instances impo
     list_instances,
 )
 from typing import Any
-from unittest.mock import MagicMock
 
 
 class TestListInstances:
     """Test list_instances function."""
 
-    @pytest.mark.asyncio
-    async def test_success(self, mock_rds_client):
-        """Test successful instance list retrieval."""
-        mock_paginator = MagicMock()
-        mock_rds_client.get_paginator.return_value = mock_paginator
-        mock_paginator.paginate.return_value = [
-            {
-                'DBInstances': [
+    @pytest.mark.parametrize(
+        'pages, expected_ids',
+        [
+            (
+                [
                     {
-                        'DBInstanceIdentifier': 'test-instance-1',
-                        'DBInstanceStatus': 'available',
-                        'Engine': 'aurora-mysql',
-                        'DBInstanceClass': 'db.r5.large',
-                        'MultiAZ': False,
-                        'PubliclyAccessible': False,
-                    },
-                    {
-                        'DBInstanceIdentifier': 'test-instance-2',
-                        'DBInstanceStatus': 'available',
-                        'Engine': 'mysql',
-                        'DBInstanceClass': 'db.t3.medium',
-                        'MultiAZ': False,
-                        'PubliclyAccessible': False,
-                    },
-                ]
-            }
-        ]
-
-        result = await list_instances()
-
-        assert result.count == 2
-        assert len(result.instances) == 2
-        assert result.instances[0].instance_id == 'test-instance-1'
-        assert result.instances[1].instance_id == 'test-instance-2'
-        assert result.resource_uri == 'aws-rds://db-instance'
-
-    @pytest.mark.asyncio
-    async def test_empty_response(self, mock_rds_client):
-        """Test handling of empty instance response."""
-        mock_paginator = MagicMock()
-        mock_rds_client.get_paginator.return_value = mock_paginator
-        mock_paginator.paginate.return_value = [{'DBInstances': []}]
+                        'DBInstances': [
+                            {
+                                'DBInstanceIdentifier': 'test-instance-1',
+                                'DBInstanceStatus': 'available',
+                                'Engine': 'aurora-mysql',
+                                'DBInstanceClass': 'db.r5.large',
+                                'MultiAZ': False,
+                                'PubliclyAccessible': False,
+                            },
+                            {
+                                'DBInstanceIdentifier': 'test-instance-2',
+                                'DBInstanceStatus': 'available',
+                                'Engine': 'mysql',
+                                'DBInstanceClass': 'db.t3.medium',
+                                'MultiAZ': False,
+                                'PubliclyAccessible': False,
+                            },
+                        ]
+                    }
+                ],
+                ['test-instance-1', 'test-instance-2'],
+            ),
+            ([{'DBInstances': []}], []),
+        ],
+        ids=['success', 'empty_response'],
+    )
+    async def test_list_instances(self, mock_rds_paginator, pages, expected_ids):
+        """Test instance list retrieval for populated and empty responses."""
+        mock_rds_paginator.paginate.return_value = pages
 
         result = await list_instances()
 
-        assert result.count == 0
-        assert len(result.instances) == 0
+        assert result.count == len(expected_ids)
+        assert [instance.instance_id for instance in result.instances] == expected_ids
         assert result.resource_uri == 'aws-rds://db-instance'
 
-    @pytest.mark.asyncio
-    async def test_calls_api_with_correct_parameters(self, mock_rds_client):
+    async def test_calls_api_with_correct_parameters(self, mock_rds_client, mock_rds_paginator):
         """Test API is called with correct parameters."""
-        mock_paginator = MagicMock()
-        mock_rds_client.get_paginator.return_value = mock_paginator
-        mock_paginator.paginate.return_value = [{'DBInstances': []}]
+        mock_rds_paginator.paginate.return_value = [{'DBInstances': []}]
 
         await list_instances()
 
         mock_rds_client.get_paginator.assert_called_once_with('describe_db_instances')
-        mock_paginator.paginate.assert_called_once_with(PaginationConfig={'MaxItems': 100})
+        mock_rds_paginator.paginate.assert_called_once_with(PaginationConfig={'MaxItems': 100})
 
 
 class TestInstanceSummary:
@@ -14,7 +14,6 @@
 
 """Tests for RDS performance reports listing functionality."""
 
-import pytest
 from awslabs.rds_monitoring_mcp_server.resources.db_instance.list_performance_reports import (
     PerformanceReportList,
     list_performance_reports,
@@ -25,7 +24,6 @@ from datetime import datetime
 class TestListPerformanceReports:
     """Tests for the list_performance_reports MCP resource."""
 
-    @pytest.mark.asyncio
     async def test_standard_response(self, mock_context, mock_pi_client):
         """Test with standard response containing performance reports."""
         mock_create_time = datetime(2023, 1, 1, 0, 0, 0)
@@ -69,7 +67,6 @@ class TestListPerformanceReports:
         assert result.reports[1].analysis_report_id == 'report-2'
         assert result.reports[1].status == 'RUNNING'
 
-    @pytest.mark.asyncio
     async def test_empty_response(self, mock_context, mock_pi_client):
         """Test with empty response containing no performance reports."""
         mock_pi_client.list_performance_analysis_reports.return_value = {'AnalysisReports': []}
@@ -80,7 +77,6 @@ class TestListPerformanceReports:
         assert result.count == 0
         assert len(result.reports) == 0
 
-    @pytest.mark.asyncio
     async def test_missing_fields(self, mock_context, mock_pi_client):
         """Test handling of missing fields in AWS response."""
         mock_create_time = datetime(2023, 1, 1, 0, 0, 0)
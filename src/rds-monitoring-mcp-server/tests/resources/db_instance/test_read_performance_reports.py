@@ -35,7 +35,6 @@ class TestReadPerformanceReport:
             'end_time': datetime(2023, 1, 1, 2, 0, 0),
         }
 
-    @pytest.mark.asyncio
     async def test_standard_response(self, mock_pi_client, mock_timestamps):
         """Test with standard response containing a complete performance report."""
         # Setup test data
@@ -91,7 +90,6 @@ class TestReadPerformanceReport:
         assert result.Insights[1]['InsightType'] == 'QUERY_ANALYSIS'
         assert result.Insights[1]['Impact'] == 'MEDIUM'
 
-    @pytest.mark.asyncio
     async def test_running_status(self, mock_pi_client, mock_timestamps):
         """Test with a report in RUNNING status (partial results)."""
         test_dbi_resource_id = 'db-instance-123'
@@ -131,7 +129,6 @@ class TestReadPerformanceReport:
         assert result.EndTime == mock_timestamps['end_time']
         assert len(result.Insights) == 0
 
-    @pytest.mark.asyncio
     async def test_failed_status(self, mock_pi_client, mock_timestamps):
         """Test with a report in FAILED status (with error information)."""
         test_dbi_resource_id = 'db-instance-123'
@@ -178,7 +175,6 @@ class TestReadPerformanceReport:
         assert result.Insights[0]['InsightType'] == 'ERROR'
         assert 'insufficient data' in result.Insights[0]['Description']
 
-    @pytest.mark.asyncio
     async def test_empty_report(self, mock_pi_client, mock_timestamps):
         """Test with an empty analysis report."""
         test_dbi_resource_id = 'db-instance-123'
@@ -217,7 +213,6 @@ class TestReadPerformanceReport:
         assert result.EndTime == mock_timestamps['end_time']
         assert not hasattr(result, 'Insights') or len(result.Insights) == 0
 
-    @pytest.mark.asyncio
     async def test_report_with_missing_fields(self, mock_pi_client, mock_timestamps):
         """Test handling of reports with missing optional fields."""
         test_dbi_resource_id = 'db-instance-123'
@@ -245,7 +240,6 @@ class TestReadPerformanceReport:
         assert result.Status == 'SUCCEEDED'
         assert len(result.Insights) == 0  # Should have empty list as default
 
-    @pytest.mark.asyncio
     async def test_model_validate_behavior(self, mock_pi_client, mock_timestamps):
         """Test that model_validate is used for creating the AnalysisReport."""
         test_dbi_resource_id = 'db-instance-123'
@@ -1,6 +1,5 @@
 """Tests for list_metrics functions."""
 
-import pytest
 from awslabs.rds_monitoring_mcp_server.resources.general.list_metrics import (
     MetricList,
     list_rds_metrics,
@@ -21,7 +20,6 @@ class TestMetricList:
 class TestListRDSMetrics:
     """Test list_rds_metrics function."""
 
-    @pytest.mark.asyncio
     async def test_invalid_resource_type(self):
         """Test with invalid resource type."""
         result = await list_rds_metrics('invalid-type', 'test-resource')
@@ -32,7 +30,6 @@ class TestListRDSMetrics:
         assert 'error' in error_response
         assert 'Unsupported resource type: invalid-type' in error_response['error_message']
 
-    @pytest.mark.asyncio
     async def test_valid_resource_types(self, mock_cloudwatch_client, mock_handle_paginated_call):
         """Test with valid resource types."""
         mock_handle_paginated_call.return_value = ['CPUUtilization']
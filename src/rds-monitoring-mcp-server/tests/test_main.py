@@ -21,9 +21,10 @@ from unittest.mock import patch
 class TestMain:
     """Tests for the main function."""
 
+    @patch('awslabs.rds_monitoring_mcp_server.main.logger')
     @patch('awslabs.rds_monitoring_mcp_server.common.server.mcp.run')
     @patch('sys.argv', ['awslabs.rds-monitoring-mcp-server'])
-    def test_main_default(self, mock_run):
+    def test_main_default(self, mock_run, mock_logger):
         """Test main function with default arguments."""
         # Call the main function
         main()
@@ -32,6 +33,10 @@ class TestMain:
         mock_run.assert_called_once()
         assert mock_run.call_args[1].get('transport') is None
 
+        # Check that logging was moved to a background queue
+        mock_logger.remove.assert_called_once()
+        assert mock_logger.add.call_args[1]['enqueue'] is True
+
     def test_module_execution(self):
         """Test the module execution when run as __main__."""
         # This test directly executes the code in the if __name__ == '__main__': block
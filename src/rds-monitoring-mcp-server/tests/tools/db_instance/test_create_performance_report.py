@@ -14,7 +14,7 @@
 
 """Tests for create_performance_report tool."""
 
-import pytest
+from awslabs.rds_monitoring_mcp_server.common.constants import MCP_SERVER_TAGS
 from awslabs.rds_monitoring_mcp_server.tools.db_instance.create_performance_report import (
     REPORT_CREATION_SUCCESS_RESPONSE,
     create_performance_report,
@@ -25,7 +25,6 @@ from unittest.mock import patch
 class TestCreatePerformanceReport:
     """Tests for the create_performance_report tool."""
 
-    @pytest.mark.asyncio
     async def test_create_performance_report_success(self, mock_pi_client):
         """Test successful performance report creation."""
         test_dbi_resource_id = 'db-ABCDEFGHIJKLMNO123456'
@@ -53,7 +52,6 @@ class TestCreatePerformanceReport:
         )
         assert result == expected_response
 
-    @pytest.mark.asyncio
     async def test_create_performance_report_with_tags(self, mock_pi_client):
         """Test performance report creation includes default tags."""
         test_dbi_resource_id = 'db-ABCDEFGHIJKLMNO123456'
@@ -83,9 +81,11 @@ class TestCreatePerformanceReport:
         tag_keys = [tag['Key'] for tag in tags_passed]
         assert 'mcp_server_version' in tag_keys
         assert 'created_by' in tag_keys
+        # boto3 receives its own copy, so the shared constant cannot be changed through it
+        assert tags_passed == [dict(tag) for tag in MCP_SERVER_TAGS]
+        assert all(passed is not shared for passed, shared in zip(tags_passed, MCP_SERVER_TAGS))
         assert test_report_id in result
 
-    @pytest.mark.asyncio
     async def test_create_performance_report_readonly_mode(self, mock_pi_client):
         """Test performance report creation fails in readonly mode."""
         test_dbi_resource_id = 'db-ABCDEFGHIJKLMNO123456'
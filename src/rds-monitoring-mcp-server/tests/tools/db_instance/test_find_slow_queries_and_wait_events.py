@@ -14,13 +14,13 @@
 
 """Tests for find_slow_queries_and_wait_events tool."""
 
-import pytest
 from awslabs.rds_monitoring_mcp_server.tools.db_instance.find_slow_queries_and_wait_events import (
     build_metric_queries,
+    fetch_resource_metrics,
     find_slow_queries_and_wait_events,
     process_metric_results,
 )
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
 
@@ -45,6 +45,64 @@ class TestBuildMetricQueries:
         assert result[0]['GroupBy']['Group'] == 'db.sql_tokenized'
         assert result[0]['GroupBy']['Limit'] == 5
 
+    def test_build_metric_queries_both(self):
+        """Test building metric queries for both dimension groups in one request."""
+        result = build_metric_queries('both', 'avg', 3)
+
+        assert len(result) == 2
+        assert [query['GroupBy']['Group'] for query in result] == [
+            'db.wait_event',
+            'db.sql_tokenized',
+        ]
+        assert all(query['Metric'] == 'db.load.avg' for query in result)
+        assert all(query['GroupBy']['Limit'] == 3 for query in result)
+
+    def test_build_metric_queries_is_memoized(self):
+        """Test that identical arguments reuse the same cached query definitions."""
+        first = build_metric_queries('db.wait_event', 'max', 7)
+        second = build_metric_queries('db.wait_event', 'max', 7)
+
+        assert first == second
+        assert first is not second
+        assert first[0] is second[0]
+
+
+class TestFetchResourceMetrics:
+    """Tests for the fetch_resource_metrics helper function."""
+
+    async def test_fetch_resource_metrics_follows_next_token(self, mock_pi_client):
+        """Test that all pages are fetched and datapoints are merged per metric result."""
+        key = {'Metric': 'db.load.avg', 'Dimensions': {'db.wait_event.name': 'CPU'}}
+        mock_pi_client.get_resource_metrics.side_effect = [
+            {
+                'MetricList': [
+                    {
+                        'Key': key,
+                        'DataPoints': [{'Timestamp': datetime(2025, 6, 1, 12), 'Value': 1.0}],
+                    }
+                ],
+                'NextToken': 'token-1',
+            },
+            {
+                'MetricList': [
+                    {
+                        'Key': key,
+                        'DataPoints': [{'Timestamp': datetime(2025, 6, 1, 13), 'Value': 2.0}],
+                    }
+                ],
+            },
+        ]
+
+        metric_list = await fetch_resource_metrics(mock_pi_client, Identifier='db-1')
+
+        assert mock_pi_client.get_resource_metrics.call_count == 2
+        second_call_kwargs = mock_pi_client.get_resource_metrics.call_args_list[1].kwargs
+        assert second_call_kwargs['NextToken'] == 'token-1'
+
+        assert len(metric_list) == 1
+        assert metric_list[0]['Key'] == key
+        assert [dp['Value'] for dp in metric_list[0]['DataPoints']] == [1.0, 2.0]
+
 
 class TestProcessMetricResults:
     """Tests for the process_metric_results helper function."""
@@ -71,6 +129,7 @@ class TestProcessMetricResults:
         assert results[0].metric_name == 'db.load.avg'
         assert results[0].dimensions == {'wait-1': 'IO:BufFileWrite'}
         assert len(results[0].datapoints) == 2
+        assert results[0].datapoints[0].timestamp == datetime(2025, 6, 1, 12, 0, 0)
         assert results[0].average_value == 2.75
 
     def test_process_metric_results_with_sql_tokenized(self):
@@ -119,11 +178,66 @@ class TestProcessMetricResults:
         assert results[1].dimensions == {'wait-3': 'Lock:tuple'}
         assert results[2].dimensions == {'wait-1': 'IO:BufFileWrite'}
 
+    def test_process_metric_results_limit_per_dimension_group(self):
+        """Test that the limit is applied separately to each dimension group."""
+        metric_list = [
+            {
+                'Key': {'Metric': 'db.load.avg', 'Dimensions': {'db.wait_event.name': 'CPU'}},
+                'DataPoints': [{'Timestamp': datetime(2025, 6, 1, 12, 0, 0), 'Value': 4.0}],
+            },
+            {
+                'Key': {'Metric': 'db.load.avg', 'Dimensions': {'db.wait_event.name': 'IO'}},
+                'DataPoints': [{'Timestamp': datetime(2025, 6, 1, 12, 0, 0), 'Value': 3.0}],
+            },
+            {
+                'Key': {'Metric': 'db.load.avg', 'Dimensions': {'db.sql_tokenized.id': 'A1'}},
+                'DataPoints': [{'Timestamp': datetime(2025, 6, 1, 12, 0, 0), 'Value': 2.0}],
+            },
+            {
+                'Key': {'Metric': 'db.load.avg', 'Dimensions': {'db.sql_tokenized.id': 'B2'}},
+                'DataPoints': [{'Timestamp': datetime(2025, 6, 1, 12, 0, 0), 'Value': 1.0}],
+            },
+        ]
+
+        results = process_metric_results(
+            metric_list=metric_list,
+            dimension='both',
+            limit=1,
+        )
+
+        assert len(results) == 2
+        assert results[0].dimensions == {'db.wait_event.name': 'CPU'}
+        assert results[1].dimensions == {'db.sql_tokenized.id': 'A1'}
+
+    def test_process_metric_results_limit_per_queried_group(self):
+        """Test that the limit applies to the queried group, not to each dimension key."""
+        metric_list = [
+            {
+                'Key': {'Metric': 'db.load.avg', 'Dimensions': {f'wait-{i}': 'CPU'}},
+                'DataPoints': [{'Timestamp': datetime(2025, 6, 1, 12, 0, 0), 'Value': value}],
+            }
+            for i, value in enumerate([3.0, 2.0, 1.0])
+        ]
+
+        single = process_metric_results(
+            metric_list=metric_list,
+            dimension='db.wait_event',
+            limit=2,
+        )
+        both = process_metric_results(
+            metric_list=metric_list,
+            dimension='both',
+            limit=2,
+        )
+
+        assert [result.dimensions for result in single] == [{'wait-0': 'CPU'}, {'wait-1': 'CPU'}]
+        # Keys without a queried group prefix share one bucket instead of one bucket each
+        assert len(both) == 2
+
 
 class TestFindSlowQueriesAndWaitEvents:
     """Tests for the find_slow_queries_and_wait_events tool."""
 
-    @pytest.mark.asyncio
     async def test_find_slow_queries_basic_execution(self, mock_pi_client, mock_context):
         """Test basic execution of the find_slow_queries_and_wait_events tool."""
         test_dbi_resource_id = 'db-ABCDEFGHIJKLMNO123456'
@@ -155,6 +269,10 @@ class TestFindSlowQueriesAndWaitEvents:
         assert result.dimension == 'db.wait_event'
         assert result.calculation == 'avg'
         assert result.period_seconds == 300
+        assert result.time_range == {
+            'start': datetime(2025, 6, 1, 12, 0, 0, tzinfo=timezone.utc),
+            'end': datetime(2025, 6, 1, 13, 0, 0, tzinfo=timezone.utc),
+        }
         assert result.count == 1
 
         metrics = result.results
@@ -164,7 +282,6 @@ class TestFindSlowQueriesAndWaitEvents:
         assert len(metrics[0].datapoints) == 2
         assert metrics[0].average_value == 2.75
 
-    @pytest.mark.asyncio
     async def test_find_slow_queries_with_sql_tokenized(self, mock_pi_client, mock_context):
         """Test find_slow_queries_and_wait_events with SQL tokenized dimension."""
         test_dbi_resource_id = 'db-ABCDEFGHIJKLMNO123456'
@@ -194,7 +311,37 @@ class TestFindSlowQueriesAndWaitEvents:
         assert len(metrics) == 1
         assert metrics[0].dimensions == {'sql-1': 'SELECT * FROM users'}
 
-    @pytest.mark.asyncio
+    async def test_find_slow_queries_with_both_dimensions(self, mock_pi_client, mock_context):
+        """Test that both dimension groups are fetched with a single API call."""
+        mock_pi_client.get_resource_metrics.return_value = {
+            'MetricList': [
+                {
+                    'Key': {'Metric': 'db.load.avg', 'Dimensions': {'db.wait_event.name': 'CPU'}},
+                    'DataPoints': [{'Timestamp': datetime(2025, 6, 1, 12, 0, 0), 'Value': 2.0}],
+                },
+                {
+                    'Key': {
+                        'Metric': 'db.load.avg',
+                        'Dimensions': {'db.sql_tokenized.statement': 'SELECT 1'},
+                    },
+                    'DataPoints': [{'Timestamp': datetime(2025, 6, 1, 12, 0, 0), 'Value': 1.0}],
+                },
+            ]
+        }
+
+        result = await find_slow_queries_and_wait_events(
+            dbi_resource_identifier='db-ABCDEFGHIJKLMNO123456',
+            dimension='both',
+            calculation='avg',
+        )
+
+        mock_pi_client.get_resource_metrics.assert_called_once()
+        metric_queries = mock_pi_client.get_resource_metrics.call_args.kwargs['MetricQueries']
+        assert len(metric_queries) == 2
+
+        assert result.dimension == 'both'
+        assert result.count == 2
+
     async def test_find_slow_queries_with_default_times(self, mock_pi_client, mock_context):
         """Test find_slow_queries_and_wait_events with default time values."""
         test_dbi_resource_id = 'db-ABCDEFGHIJKLMNO123456'
@@ -221,7 +368,6 @@ class TestFindSlowQueriesAndWaitEvents:
         end_time = call_kwargs['EndTime']
         assert end_time - start_time == timedelta(hours=1)
 
-    @pytest.mark.asyncio
     async def test_find_slow_queries_custom_limit(self, mock_pi_client, mock_context):
         """Test find_slow_queries_and_wait_events with custom result limit."""
         test_dbi_resource_id = 'db-ABCDEFGHIJKLMNO123456'
@@ -14,11 +14,13 @@
 
 """Tests for read_db_log_file tool."""
 
-import pytest
+import json
+import time
 from awslabs.rds_monitoring_mcp_server.tools.db_instance.read_rds_db_file import (
     preprocess_log_content,
     read_db_log_file,
 )
+from botocore.exceptions import ClientError
 from collections import defaultdict, deque
 from unittest.mock import patch
 
@@ -26,14 +28,12 @@ from unittest.mock import patch
 class TestPreprocessLogContent:
     """Tests for the preprocess_log_content helper function."""
 
-    @pytest.mark.asyncio
     async def test_preprocess_log_content_no_pattern(self):
         """Test preprocessing log content without a pattern filter."""
         log_content = 'Line 1\nLine 2\nError: Something went wrong\nLine 4'
         result = await preprocess_log_content(log_content, None)
         assert result == log_content
 
-    @pytest.mark.asyncio
     async def test_preprocess_log_content_with_pattern(self):
         """Test preprocessing log content with a pattern filter."""
         log_content = 'Line 1\nLine 2\nError: Something went wrong\nLine 4'
@@ -41,7 +41,6 @@ class TestPreprocessLogContent:
         result = await preprocess_log_content(log_content, pattern)
         assert result == 'Error: Something went wrong'
 
-    @pytest.mark.asyncio
     async def test_preprocess_log_content_with_pattern_no_matches(self):
         """Test preprocessing log content with a pattern filter that has no matches."""
         log_content = 'Line 1\nLine 2\nLine 3\nLine 4'
@@ -49,7 +48,6 @@ class TestPreprocessLogContent:
         result = await preprocess_log_content(log_content, pattern)
         assert result == ''
 
-    @pytest.mark.asyncio
     async def test_preprocess_log_content_empty_log(self):
         """Test preprocessing empty log content."""
         log_content = ''
@@ -57,11 +55,22 @@ class TestPreprocessLogContent:
         result = await preprocess_log_content(log_content, pattern)
         assert result == ''
 
+    async def test_preprocess_log_content_with_pattern_multiple_matches(self):
+        """Test that every matching line is returned once, in order."""
+        log_content = 'Error 1\r\nLine 2\nError 3 Error again\nLine 4\nError 5'
+        result = await preprocess_log_content(log_content, 'Error')
+        assert result == 'Error 1\nError 3 Error again\nError 5'
+
+    async def test_preprocess_log_content_with_regex(self):
+        """Test preprocessing log content with a regular expression filter."""
+        log_content = 'Line 1\r\nERROR 42\n\nLine 4\nFATAL 7'
+        result = await preprocess_log_content(log_content, r'^(ERROR|FATAL) \d+$', use_regex=True)
+        assert result == 'ERROR 42\nFATAL 7'
+
 
 class TestReadDbLogFile:
     """Tests for the read_db_log_file tool."""
 
-    @pytest.mark.asyncio
     @patch(
         'awslabs.rds_monitoring_mcp_server.common.decorators.rate_limit._call_times',
         defaultdict(deque),
@@ -92,7 +101,6 @@ class TestReadDbLogFile:
         assert result.next_marker is None
         assert result.additional_data_pending is False
 
-    @pytest.mark.asyncio
     @patch(
         'awslabs.rds_monitoring_mcp_server.common.decorators.rate_limit._call_times',
         defaultdict(deque),
@@ -119,7 +127,6 @@ class TestReadDbLogFile:
         assert 'ERROR: relation users does not exist' in result.log_content
         assert 'LOG: database system is ready' not in result.log_content
 
-    @pytest.mark.asyncio
     @patch(
         'awslabs.rds_monitoring_mcp_server.common.decorators.rate_limit._call_times',
         defaultdict(deque),
@@ -151,7 +158,6 @@ class TestReadDbLogFile:
         assert result.next_marker == test_next_marker
         assert result.additional_data_pending is True
 
-    @pytest.mark.asyncio
     @patch(
         'awslabs.rds_monitoring_mcp_server.common.decorators.rate_limit._call_times',
         defaultdict(deque),
@@ -178,7 +184,6 @@ class TestReadDbLogFile:
         call_args, call_kwargs = mock_rds_client.download_db_log_file_portion.call_args
         assert call_kwargs['NumberOfLines'] == custom_line_count
 
-    @pytest.mark.asyncio
     @patch(
         'awslabs.rds_monitoring_mcp_server.common.decorators.rate_limit._call_times',
         defaultdict(deque),
@@ -201,3 +206,160 @@ class TestReadDbLogFile:
         assert result.log_content == ''
         assert result.next_marker is None
         assert result.additional_data_pending is False
+
+    @patch(
+        'awslabs.rds_monitoring_mcp_server.common.decorators.rate_limit._call_times',
+        defaultdict(deque),
+    )
+    async def test_read_db_log_file_pattern_reads_until_enough_matches(
+        self, mock_rds_client, mock_context
+    ):
+        """Test that pattern filtering keeps reading portions until enough lines match."""
+        mock_rds_client.download_db_log_file_portion.side_effect = [
+            {'LogFileData': 'LOG: a\nERROR: 1', 'Marker': '10', 'AdditionalDataPending': True},
+            {'LogFileData': 'LOG: b\nLOG: c', 'Marker': '20', 'AdditionalDataPending': True},
+            {'LogFileData': 'ERROR: 2\nLOG: d', 'Marker': '30', 'AdditionalDataPending': True},
+            {'LogFileData': 'ERROR: 3', 'Marker': '40', 'AdditionalDataPending': True},
+        ]
+
+        result = await read_db_log_file(
+            db_instance_identifier='test-db-instance',
+            log_file_name='error/postgresql.log',
+            number_of_lines=2,
+            pattern='ERROR',
+        )
+
+        assert mock_rds_client.download_db_log_file_portion.call_count == 3
+        markers = [
+            call.kwargs.get('Marker')
+            for call in mock_rds_client.download_db_log_file_portion.call_args_list
+        ]
+        assert markers == [None, '10', '20']
+        assert result.log_content == 'ERROR: 1\nERROR: 2'
+        assert result.next_marker == '30'
+        assert result.additional_data_pending is True
+
+    @patch(
+        'awslabs.rds_monitoring_mcp_server.common.decorators.rate_limit._call_times',
+        defaultdict(deque),
+    )
+    async def test_read_db_log_file_pattern_trims_to_number_of_lines(
+        self, mock_rds_client, mock_context
+    ):
+        """Test that lines collected across portions are capped at number_of_lines."""
+        mock_rds_client.download_db_log_file_portion.side_effect = [
+            {'LogFileData': 'ERROR: 1\nLOG: a', 'Marker': '10', 'AdditionalDataPending': True},
+            {'LogFileData': 'ERROR: 2\nERROR: 3', 'Marker': '20', 'AdditionalDataPending': True},
+        ]
+
+        result = await read_db_log_file(
+            db_instance_identifier='test-db-instance',
+            log_file_name='error/postgresql.log',
+            number_of_lines=2,
+            pattern='ERROR',
+        )
+
+        assert mock_rds_client.download_db_log_file_portion.call_count == 2
+        assert result.log_content == 'ERROR: 1\nERROR: 2'
+
+    @patch(
+        'awslabs.rds_monitoring_mcp_server.common.decorators.rate_limit._call_times',
+        defaultdict(deque),
+    )
+    async def test_read_db_log_file_invalid_regex_reads_one_portion(
+        self, mock_rds_client, mock_context
+    ):
+        """Test that an invalid regex returns the first portion unfiltered and stops there."""
+        mock_rds_client.download_db_log_file_portion.side_effect = [
+            {'LogFileData': 'LOG: a\nLOG: b', 'Marker': '10', 'AdditionalDataPending': True},
+            {'LogFileData': 'LOG: c', 'Marker': '20', 'AdditionalDataPending': True},
+        ]
+
+        result = await read_db_log_file(
+            db_instance_identifier='test-db-instance',
+            log_file_name='error/postgresql.log',
+            pattern='ERROR[',
+            use_regex=True,
+        )
+
+        mock_rds_client.download_db_log_file_portion.assert_called_once()
+        assert result.log_content == 'LOG: a\nLOG: b'
+        assert result.next_marker == '10'
+
+    @patch(
+        'awslabs.rds_monitoring_mcp_server.common.decorators.rate_limit._call_times',
+        defaultdict(deque),
+    )
+    async def test_read_db_log_file_pattern_stops_on_download_error(
+        self, mock_rds_client, mock_context
+    ):
+        """Test that a failed download ends the read without requesting further portions."""
+        mock_rds_client.download_db_log_file_portion.side_effect = [
+            {'LogFileData': 'LOG: a', 'Marker': '10', 'AdditionalDataPending': True},
+            ClientError(
+                {'Error': {'Code': 'Throttling', 'Message': 'Rate exceeded'}},
+                'DownloadDBLogFilePortion',
+            ),
+            {'LogFileData': 'ERROR: 1', 'Marker': '30', 'AdditionalDataPending': True},
+        ]
+
+        result = await read_db_log_file(
+            db_instance_identifier='test-db-instance',
+            log_file_name='error/postgresql.log',
+            pattern='ERROR',
+        )
+
+        assert mock_rds_client.download_db_log_file_portion.call_count == 2
+        assert json.loads(result)['error_code'] == 'Throttling'
+
+    @patch(
+        'awslabs.rds_monitoring_mcp_server.common.decorators.rate_limit._call_times',
+        defaultdict(deque),
+    )
+    async def test_read_db_log_file_pattern_respects_max_api_calls(
+        self, mock_rds_client, mock_context
+    ):
+        """Test that pattern filtering stops after max_api_calls portions."""
+        mock_rds_client.download_db_log_file_portion.side_effect = [
+            {'LogFileData': 'LOG: a', 'Marker': str(i), 'AdditionalDataPending': True}
+            for i in range(1, 4)
+        ]
+
+        result = await read_db_log_file(
+            db_instance_identifier='test-db-instance',
+            log_file_name='error/postgresql.log',
+            pattern='ERROR',
+            max_api_calls=2,
+        )
+
+        assert mock_rds_client.download_db_log_file_portion.call_count == 2
+        assert result.log_content == ''
+        assert result.next_marker == '2'
+        assert result.additional_data_pending is True
+
+    async def test_read_db_log_file_pattern_counts_portions_against_rate_limit(
+        self, mock_rds_client, mock_context
+    ):
+        """Test that every portion read counts toward the rate limit."""
+        mock_rds_client.download_db_log_file_portion.side_effect = [
+            {'LogFileData': 'LOG: a', 'Marker': str(i), 'AdditionalDataPending': True}
+            for i in range(1, 6)
+        ]
+        call_times = defaultdict(deque)
+        call_times['read_db_log_file'].append(time.time())
+
+        with patch(
+            'awslabs.rds_monitoring_mcp_server.common.decorators.rate_limit._call_times',
+            call_times,
+        ):
+            result = await read_db_log_file(
+                db_instance_identifier='test-db-instance',
+                log_file_name='error/postgresql.log',
+                pattern='ERROR',
+            )
+
+        # One earlier call plus this call's two portions exhaust the budget of three
+        assert mock_rds_client.download_db_log_file_portion.call_count == 2
+        assert len(call_times['read_db_log_file']) == 3
+        assert result.next_marker == '2'
+        assert result.additional_data_pending is True
@@ -7,6 +7,7 @@ from awslabs.rds_monitoring_mcp_server.tools.general.describe_rds_events import
     describe_rds_events,
 )
 from datetime import datetime, timezone
+from pydantic import ValidationError
 
 
 def create_test_event():
@@ -30,7 +31,7 @@ class TestEvent:
         assert isinstance(formatted_event, Event)
         assert formatted_event.message == 'Test event message'
         assert formatted_event.event_categories == ['backup', 'recovery']
-        assert formatted_event.date == '2025-01-01T00:00:00+00:00'
+        assert formatted_event.date == datetime(2025, 1, 1, tzinfo=timezone.utc)
         assert formatted_event.source_arn == 'arn:aws:rds:us-west-2:123456789012:db:test-instance'
 
     def test_from_event_data_no_date(self):
@@ -39,7 +40,7 @@ class TestEvent:
         event_no_date['Date'] = None
         formatted_event = Event.from_event_data(event_no_date)
 
-        assert formatted_event.date == ''
+        assert formatted_event.date is None
 
     def test_from_event_data_string_date(self):
         """Test Event.from_event_data with string date."""
@@ -47,7 +48,15 @@ class TestEvent:
         event_string_date['Date'] = '2025-01-01'
         formatted_event = Event.from_event_data(event_string_date)
 
-        assert formatted_event.date == '2025-01-01'
+        assert formatted_event.date == datetime(2025, 1, 1)
+
+    def test_from_event_data_invalid_date(self):
+        """Test Event.from_event_data rejects a date that is not a valid datetime."""
+        event_invalid_date = create_test_event()
+        event_invalid_date['Date'] = 'not-a-date'
+
+        with pytest.raises(ValidationError):
+            Event.from_event_data(event_invalid_date)
 
     def test_from_event_data_minimal(self):
         """Test Event.from_event_data with minimal data."""
@@ -56,14 +65,13 @@ class TestEvent:
 
         assert formatted_event.message == ''
         assert formatted_event.event_categories == []
-        assert formatted_event.date == ''
+        assert formatted_event.date is None
         assert formatted_event.source_arn is None
 
 
 class TestDescribeRDSEvents:
     """Tests for the describe_rds_events function."""
 
-    @pytest.mark.asyncio
     async def test_describe_rds_events_basic(self, mock_rds_client, mock_context):
         """Test the describe_rds_events function with basic parameters."""
         mock_rds_client.describe_events.return_value = {'Events': [create_test_event()]}
@@ -89,7 +97,6 @@ class TestDescribeRDSEvents:
         assert event.event_categories == ['backup', 'recovery']
         assert event.source_arn == 'arn:aws:rds:us-west-2:123456789012:db:test-instance'
 
-    @pytest.mark.asyncio
     async def test_describe_rds_events_with_filters(self, mock_rds_client, mock_context):
         """Test the describe_rds_events function with various filters."""
         mock_rds_client.describe_events.return_value = {'Events': [create_test_event()]}
@@ -114,7 +121,6 @@ class TestDescribeRDSEvents:
         assert call_kwargs['EndTime'] == '2025-01-02T00:00:00Z'
         assert isinstance(result, EventList)
 
-    @pytest.mark.asyncio
     async def test_describe_rds_events_no_events(self, mock_rds_client, mock_context):
         """Test the describe_rds_events function when no events are found."""
         mock_rds_client.describe_events.return_value = {'Events': []}
@@ -128,7 +134,6 @@ class TestDescribeRDSEvents:
         assert result.count == 0
         assert len(result.events) == 0
 
-    @pytest.mark.asyncio
     async def test_describe_rds_events_different_source_types(self, mock_rds_client, mock_context):
         """Test the describe_rds_events function with different source types."""
         mock_rds_client.describe_events.return_value = {'Events': [create_test_event()]}
@@ -1,13 +1,16 @@
 """Tests for the describe_rds_performance_metrics module."""
 
-import pytest
+import importlib
+from awslabs.rds_monitoring_mcp_server.common.context import RDSContext
 from awslabs.rds_monitoring_mcp_server.tools.general.describe_rds_performance_metrics import (
     DataPoint,
     MetricSummary,
     MetricSummaryList,
+    build_metric_queries,
     describe_rds_performance_metrics,
 )
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 
 def create_test_metric_data_result():
@@ -24,6 +27,41 @@ def create_test_metric_data_result():
     }
 
 
+class TestBuildMetricQueries:
+    """Tests for the build_metric_queries helper function."""
+
+    def test_build_metric_queries_instance(self):
+        """Test building queries for an instance."""
+        queries = build_metric_queries('INSTANCE', 'test-instance', 60, 'Average')
+
+        assert len(queries) == 14
+        query = queries[0]
+        assert query['Id'] == 'metric_BurstBalance_Average'
+        assert query['MetricStat']['Period'] == 60
+        assert query['MetricStat']['Stat'] == 'Average'
+        assert query['MetricStat']['Metric']['Dimensions'] == [
+            {'Name': 'DBInstanceIdentifier', 'Value': 'test-instance'}
+        ]
+
+    def test_build_metric_queries_cluster_dimension(self):
+        """Test that cluster queries use the cluster identifier dimension."""
+        queries = build_metric_queries('CLUSTER', 'test-cluster', 300, 'Maximum')
+
+        assert len(queries) == 8
+        assert all(
+            q['MetricStat']['Metric']['Dimensions'][0]['Name'] == 'DBClusterIdentifier'
+            for q in queries
+        )
+
+    def test_build_metric_queries_is_memoized(self):
+        """Test that repeated calls reuse the same query objects but return new lists."""
+        first = build_metric_queries('INSTANCE', 'test-instance', 60, 'Sum')
+        second = build_metric_queries('INSTANCE', 'test-instance', 60, 'Sum')
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+
+
 class TestMetricSummary:
     """Tests for MetricSummary model."""
 
@@ -52,6 +90,8 @@ class TestMetricSummary:
         assert result.avg_value == 50.0
         assert result.data_points_count == 3
         assert len(result.sample_data_points) == 3
+        assert [dp.value for dp in result.sample_data_points] == [60.0, 50.0, 40.0]
+        assert result.sample_data_points[0].timestamp < result.sample_data_points[-1].timestamp
 
     def test_from_metric_data_empty_values(self):
         """Test MetricSummary.from_metric_data with empty values."""
@@ -69,6 +109,9 @@ class TestMetricSummary:
         assert result.current_value == 0
         assert result.data_points_count == 0
         assert len(result.sample_data_points) == 0
+        assert result.model_dump_json(include={'min_value', 'avg_value'}) == (
+            '{"min_value":0.0,"avg_value":0.0}'
+        )
 
     def test_from_metric_data_stable_trend(self):
         """Test MetricSummary with stable values."""
@@ -105,11 +148,52 @@ class TestMetricSummary:
         assert result.min_value == 50.0
         assert result.max_value == 60.0
 
+    def test_from_metric_data_sampling_keeps_extremes(self):
+        """Test that sampling keeps the endpoints and the extremes of each interval."""
+        timestamps = [
+            datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=i) for i in range(12)
+        ]
+        values = [5.0, 4.0, 90.0, 6.0, 5.0, 1.0, 5.0, 7.0, 5.0, 2.0, 80.0, 5.0]
+        metric_data = {
+            'Id': 'metric_test',
+            'Label': 'test',
+            'Values': values,
+            'Timestamps': timestamps,
+            'StatusCode': 'Complete',
+        }
+
+        with patch.object(RDSContext, 'max_items', return_value=6):
+            result = MetricSummary.from_metric_data(metric_data)
+
+        assert result.data_points_count == 12
+        assert [dp.value for dp in result.sample_data_points] == [5.0, 90.0, 1.0, 2.0, 80.0, 5.0]
+        assert result.sample_data_points[0].timestamp == timestamps[0]
+        assert result.sample_data_points[-1].timestamp == timestamps[-1]
+        assert [dp.timestamp for dp in result.sample_data_points] == sorted(
+            dp.timestamp for dp in result.sample_data_points
+        )
+
+    def test_from_metric_data_sampling_few_points(self):
+        """Test that very small sample sizes fall back to evenly spaced points."""
+        metric_data = {
+            'Id': 'metric_test',
+            'Label': 'test',
+            'Values': [float(i) for i in range(10)],
+            'Timestamps': [
+                datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=i) for i in range(10)
+            ],
+            'StatusCode': 'Complete',
+        }
+
+        with patch.object(RDSContext, 'max_items', return_value=3):
+            result = MetricSummary.from_metric_data(metric_data)
+
+        assert [dp.value for dp in result.sample_data_points] == [0.0, 4.0, 9.0]
+
 
 class TestDescribeRDSPerformanceMetrics:
     """Tests for the describe_rds_performance_metrics function."""
 
-    @pytest.mark.asyncio
     async def test_describe_rds_performance_metrics_instance(
         self, mock_cloudwatch_client, mock_handle_paginated_call
     ):
@@ -143,7 +227,6 @@ class TestDescribeRDSPerformanceMetrics:
         assert result.resource_identifier == 'test-instance'
         assert result.resource_type == 'INSTANCE'
 
-    @pytest.mark.asyncio
     async def test_describe_rds_performance_metrics_cluster(
         self, mock_cloudwatch_client, mock_handle_paginated_call
     ):
@@ -175,7 +258,6 @@ class TestDescribeRDSPerformanceMetrics:
 
         assert result.resource_type == 'CLUSTER'
 
-    @pytest.mark.asyncio
     async def test_describe_rds_performance_metrics_global_cluster(
         self, mock_cloudwatch_client, mock_handle_paginated_call
     ):
@@ -206,3 +288,37 @@ class TestDescribeRDSPerformanceMetrics:
         )
 
         assert result.resource_type == 'GLOBAL_CLUSTER'
+
+    async def test_describe_rds_performance_metrics_batches_queries(
+        self, mock_cloudwatch_client, mock_context
+    ):
+        """Test that metric queries beyond the per-request limit are split into batches."""
+        module = importlib.import_module(
+            'awslabs.rds_monitoring_mcp_server.tools.general.describe_rds_performance_metrics'
+        )
+        with (
+            patch.object(module, 'MAX_METRIC_DATA_QUERIES', 5),
+            patch.object(module, 'handle_paginated_aws_api_call') as mock_paginated_call,
+        ):
+            mock_paginated_call.side_effect = lambda **kwargs: [
+                MetricSummary.from_metric_data({'Id': query['Id']})
+                for query in kwargs['operation_parameters']['MetricDataQueries']
+            ]
+
+            result = await describe_rds_performance_metrics(
+                resource_identifier='test-instance',
+                resource_type='INSTANCE',
+                start_date='2025-01-01T00:00:00Z',
+                end_date='2025-01-02T00:00:00Z',
+                period=60,
+                stat='Average',
+                scan_by='TimestampAscending',
+            )
+
+        batch_sizes = sorted(
+            len(call.kwargs['operation_parameters']['MetricDataQueries'])
+            for call in mock_paginated_call.call_args_list
+        )
+        assert batch_sizes == [4, 5, 5]
+        assert isinstance(result, MetricSummaryList)
+        assert len(result.metrics) == 14
@@ -1,16 +1,33 @@
 """Tests for describe_rds_recommendations function."""
 
+import importlib
+import json
 import pytest
 from awslabs.rds_monitoring_mcp_server.tools.general.describe_rds_recommendations import (
     DBRecommendationList,
     describe_rds_recommendations,
 )
+from datetime import datetime
+from pydantic_core import to_json
+from unittest.mock import patch
+
+
+recommendations_module = importlib.import_module(
+    'awslabs.rds_monitoring_mcp_server.tools.general.describe_rds_recommendations'
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    """Start every test with an empty result cache."""
+    recommendations_module._RESULT_CACHE.clear()
+    yield
+    recommendations_module._RESULT_CACHE.clear()
 
 
 class TestDescribeRDSRecommendations:
     """Test describe_rds_recommendations function."""
 
-    @pytest.mark.asyncio
     async def test_with_status_filter(self, mock_rds_client, mock_handle_paginated_call):
         """Test describe_rds_recommendations with status filter."""
         mock_recommendations = []
@@ -22,7 +39,6 @@ class TestDescribeRDSRecommendations:
         assert result.count == 0
         assert len(result.recommendations) == 0
 
-    @pytest.mark.asyncio
     async def test_with_severity_filter(self, mock_rds_client, mock_handle_paginated_call):
         """Test describe_rds_recommendations with severity filter."""
         mock_recommendations = []
@@ -33,8 +49,7 @@ class TestDescribeRDSRecommendations:
 
         assert result.count == 0
 
-    @pytest.mark.asyncio
-    async def test_with_resource_filters(self, mock_rds_client, mock_handle_paginated_call):
+    async def test_with_resource_filters(self, mock_rds_paginator, mock_handle_paginated_call):
         """Test describe_rds_recommendations with resource ID filters."""
         mock_recommendations = []
 
@@ -45,8 +60,12 @@ class TestDescribeRDSRecommendations:
         )
 
         assert result.count == 0
+        params = mock_rds_paginator.paginate.call_args[1]
+        assert params['Filters'] == [
+            {'Name': 'cluster-resource-id', 'Values': ['cluster-123']},
+            {'Name': 'dbi-resource-id', 'Values': ['db-456']},
+        ]
 
-    @pytest.mark.asyncio
     async def test_with_time_filters(self, mock_rds_client, mock_handle_paginated_call):
         """Test describe_rds_recommendations with time filters."""
         mock_recommendations = []
@@ -59,6 +78,112 @@ class TestDescribeRDSRecommendations:
 
         assert result.count == 0
 
+    async def test_collects_all_pages(self, mock_rds_client, mock_rds_paginator):
+        """Test describe_rds_recommendations collects recommendations from every page."""
+        mock_rds_paginator.paginate.return_value = [
+            {'DBRecommendations': [{'RecommendationId': 'rec-1'}]},
+            {'DBRecommendations': [{'RecommendationId': 'rec-2'}]},
+        ]
+
+        result = await describe_rds_recommendations(status='active')
+
+        assert result.count == 2
+        assert [rec['RecommendationId'] for rec in result.recommendations] == ['rec-1', 'rec-2']
+        mock_rds_client.get_paginator.assert_called_once_with('describe_db_recommendations')
+
+    async def test_result_serializes_timestamps(self, mock_rds_paginator):
+        """Test the unvalidated result still serializes boto3 datetimes to ISO strings."""
+        mock_rds_paginator.paginate.return_value = [
+            {
+                'DBRecommendations': [
+                    {'RecommendationId': 'rec-1', 'CreatedTime': datetime(2025, 7, 20, 14, 30)}
+                ]
+            }
+        ]
+
+        result = await describe_rds_recommendations(status='active')
+
+        payload = json.loads(to_json(result))
+        assert payload['count'] == 1
+        assert payload['recommendations'][0]['CreatedTime'] == '2025-07-20T14:30:00'
+
+    async def test_repeated_query_is_cached(self, mock_rds_paginator):
+        """Test an identical query within the TTL does not call AWS again."""
+        mock_rds_paginator.paginate.return_value = [
+            {'DBRecommendations': [{'RecommendationId': 'rec-1'}]}
+        ]
+
+        first = await describe_rds_recommendations(severity='high')
+        second = await describe_rds_recommendations(severity='high')
+        await describe_rds_recommendations(severity='low')
+
+        assert second == first
+        assert mock_rds_paginator.paginate.call_count == 2
+
+    async def test_cached_result_is_not_shared(self, mock_rds_paginator):
+        """Test that changing a returned result does not affect later cached responses."""
+        mock_rds_paginator.paginate.return_value = [
+            {'DBRecommendations': [{'RecommendationId': 'rec-1'}]}
+        ]
+
+        first = await describe_rds_recommendations(severity='high')
+        first.recommendations.append({'RecommendationId': 'rec-2'})
+        first.recommendations[0]['RecommendationId'] = 'changed'
+        second = await describe_rds_recommendations(severity='high')
+
+        assert second is not first
+        assert second.recommendations == [{'RecommendationId': 'rec-1'}]
+        assert mock_rds_paginator.paginate.call_count == 1
+
+    async def test_cached_result_expires(self, mock_rds_paginator):
+        """Test a cached result is refreshed once the TTL has passed."""
+        mock_rds_paginator.paginate.return_value = []
+
+        with patch.object(recommendations_module.time, 'monotonic', return_value=1000.0):
+            await describe_rds_recommendations(status='active')
+        expired = 1000.0 + recommendations_module.RESULT_CACHE_TTL_SECONDS
+        with patch.object(recommendations_module.time, 'monotonic', return_value=expired):
+            await describe_rds_recommendations(status='active')
+
+        assert mock_rds_paginator.paginate.call_count == 2
+
+    def test_cache_evicts_oldest_entry(self):
+        """Test the cache stays bounded by evicting the oldest query."""
+        result = DBRecommendationList(recommendations=[], count=0)
+        for i in range(recommendations_module.RESULT_CACHE_MAX_ENTRIES + 1):
+            recommendations_module.cache_result((i,), result)
+
+        assert len(recommendations_module._RESULT_CACHE) == (
+            recommendations_module.RESULT_CACHE_MAX_ENTRIES
+        )
+        assert recommendations_module.get_cached_result((0,)) is None
+        assert recommendations_module.get_cached_result((1,)) == result
+
+    def test_cache_evicts_expired_entries_first(self):
+        """Test expired entries are purged before the oldest live entry is evicted."""
+        result = DBRecommendationList(recommendations=[], count=0)
+        ttl = recommendations_module.RESULT_CACHE_TTL_SECONDS
+        monotonic = patch.object(recommendations_module.time, 'monotonic')
+
+        with monotonic as clock:
+            clock.return_value = 1000.0
+            for i in range(recommendations_module.RESULT_CACHE_MAX_ENTRIES):
+                recommendations_module.cache_result((i,), result)
+            # Refreshing an entry extends its lifetime but keeps its place as the oldest key
+            clock.return_value = 1000.0 + ttl / 2
+            recommendations_module.cache_result((0,), result)
+
+            clock.return_value = 1000.0 + ttl
+            recommendations_module.cache_result(('new',), result)
+
+            assert set(recommendations_module._RESULT_CACHE) == {(0,), ('new',)}
+            assert recommendations_module.get_cached_result((0,)) == result
+
+    def test_description_states_cache_ttl(self):
+        """Test the tool description reports the configured cache lifetime."""
+        ttl = recommendations_module.RESULT_CACHE_TTL_SECONDS
+        assert f'within {ttl} seconds' in recommendations_module.TOOL_DESCRIPTION
+
 
 class TestDBRecommendationList:
     """Test DBRecommendationList model."""